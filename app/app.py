@@ -1,14 +1,23 @@
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.common.exceptions import DomainException
 from app.common.utils.logging import setup_logging
 from app.core.config import get_settings
-from app.infrastructure.db.config import close_db, init_db
+from app.infrastructure.cache.cache_service import get_cache_service
+from app.infrastructure.cache.redis_client import redis_client
+from app.infrastructure.db.config import check_database_connection, close_db, init_db
+from app.infrastructure.security.password import shutdown_password_pool
 from app.presentation.auth import router as auth_router
 from app.presentation.exceptions import (
     domain_exception_handler,
@@ -17,7 +26,6 @@ from app.presentation.exceptions import (
 )
 from app.presentation.middleware.rate_limit import (
     RateLimitExceeded,
-    RateLimitMiddleware,
     limiter,
     rate_limit_exception_handler,
 )
@@ -35,10 +43,6 @@ setup_logging(log_level=settings.log_level, json_format=settings.log_json_format
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
-    import logging
-
-    from app.infrastructure.cache.redis_client import redis_client
-
     logger = logging.getLogger(__name__)
 
     # Startup banner
@@ -55,6 +59,7 @@ async def lifespan(app: FastAPI):
     redis_ok, redis_msg = await redis_client.health_check()
     if redis_ok:
         logger.info(f"Redis: {redis_msg}")
+        await get_cache_service().start_invalidation_listener()
     else:
         logger.warning(f"Redis: {redis_msg} (caching disabled)")
 
@@ -72,8 +77,10 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutdown initiated")
+    await get_cache_service().stop_invalidation_listener()
     await redis_client.disconnect()
     await close_db()
+    shutdown_password_pool()
 
 
 app = FastAPI(
@@ -101,38 +108,33 @@ app = FastAPI(
     version="1.0.0",
     contact={"name": "Keniiy", "email": "kehindekehinde894@gmail.com"},
     lifespan=lifespan,
+    # response_model output is serialized by pydantic-core, then encoded with orjson
+    default_response_class=ORJSONResponse,
 )
 
 
-# Add CORS middleware
-def get_cors_origins() -> list[str]:
-    """
-    Get CORS allowed origins based on environment.
-    - Development: Allow all origins ("*")
-    - Production: Use CORS_ORIGINS from settings (comma-separated list)
-    """
-    if settings.debug:
-        return ["*"]  # Allow all in development
-
-    # In production, use configured origins
-    cors_origins = settings.cors_origins
-    if cors_origins == "*":
-        import logging
-
-        logger = logging.getLogger(__name__)
-        logger.warning(
-            "⚠️  CORS_ORIGINS is set to '*' in production. "
-            "This is insecure! Set CORS_ORIGINS to specific domains."
-        )
-        return ["*"]
-    if isinstance(cors_origins, str):
-        return [cors_origins]
-    return cors_origins  # Already a list
-
+# CORS allowed origins, resolved once at import.
+# - Development: Allow all origins ("*")
+# - Production: Use CORS_ORIGINS from settings (already normalized by the Settings validator)
+if settings.debug or settings.cors_origins == "*":
+    CORS_ORIGINS: list[str] = ["*"]
+else:
+    CORS_ORIGINS = (
+        [settings.cors_origins]
+        if isinstance(settings.cors_origins, str)
+        else list(settings.cors_origins)
+    )
+
+if not settings.debug and settings.cors_origins == "*":
+    logging.getLogger(__name__).warning(
+        "⚠️  CORS_ORIGINS is set to '*' in production. "
+        "This is insecure! Set CORS_ORIGINS to specific domains."
+    )
 
+# Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_cors_origins(),
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -140,7 +142,6 @@ app.add_middleware(
 
 # Add custom middleware (order matters - first added is outermost)
 app.add_middleware(TraceIDMiddleware)  # Add trace IDs to all requests
-app.add_middleware(RateLimitMiddleware)  # Apply global rate limiting to all endpoints
 
 # Register exception handlers (order matters - most specific first)
 app.add_exception_handler(DomainException, domain_exception_handler)
@@ -155,28 +156,69 @@ app.state.limiter = limiter
 app.include_router(auth_router)
 
 
-@app.get("/health")
-async def health():
-    """Enhanced health check endpoint"""
-    from app.infrastructure.cache.redis_client import redis_client
-    from app.infrastructure.db.config import get_client
+# In-process cache for /health so frequent load balancer probes don't hit MongoDB/Redis.
+# The encoded body is cached so cache hits skip JSON serialization entirely.
+_health_cache: dict[str, Any] = {"expires": 0.0, "status_code": 200, "body": b""}
+_health_lock = asyncio.Lock()
+
+# Prebuilt 503 bodies for database outages (non-debug), keyed by Redis connectivity
+_DEGRADED_BODIES: dict[bool, bytes] = {
+    redis_ok: orjson.dumps(
+        {
+            "status": "degraded",
+            "service": "api",
+            "version": "1.0.0",
+            "database": "disconnected",
+            "database_error": "Database connection failed",
+            "redis": "connected" if redis_ok else "disconnected",
+        }
+    )
+    for redis_ok in (True, False)
+}
+
+
+async def _check_health() -> tuple[int, bytes]:
+    """Run the database and Redis connectivity checks concurrently"""
+    (db_ok, db_msg), (redis_ok, redis_msg) = await asyncio.gather(
+        check_database_connection(), redis_client.health_check()
+    )
+
+    # Outages without debug details always produce the same body
+    if not db_ok and not settings.debug:
+        return 503, _DEGRADED_BODIES[redis_ok]
 
     health_status = {"status": "ok", "service": "api", "version": "1.0.0"}
 
-    # Check database connectivity
-    try:
-        client = get_client()
-        await client.admin.command("ping")
+    # Database connectivity
+    if db_ok:
         health_status["database"] = "connected"
-    except Exception as e:
+    else:
         health_status["database"] = "disconnected"
-        health_status["database_error"] = str(e) if settings.debug else "Database connection failed"
+        health_status["database_error"] = db_msg
         health_status["status"] = "degraded"
 
-    # Check Redis connectivity
-    redis_ok, redis_msg = await redis_client.health_check()
+    # Redis connectivity
     health_status["redis"] = "connected" if redis_ok else "disconnected"
     if not redis_ok and settings.debug:
         health_status["redis_error"] = redis_msg
 
-    return health_status
+    return (200 if db_ok else 503), orjson.dumps(health_status)
+
+
+@app.get("/health")
+async def health():
+    """Enhanced health check endpoint (results cached for HEALTH_CACHE_TTL seconds)"""
+    if time.monotonic() >= _health_cache["expires"]:
+        async with _health_lock:
+            # Another request may have refreshed the cache while we waited for the lock
+            if time.monotonic() >= _health_cache["expires"]:
+                status_code, body = await _check_health()
+                _health_cache["status_code"] = status_code
+                _health_cache["body"] = body
+                _health_cache["expires"] = time.monotonic() + settings.health_cache_ttl
+
+    return Response(
+        content=_health_cache["body"],
+        status_code=_health_cache["status_code"],
+        media_type="application/json",
+    )
@@ -5,9 +5,41 @@ User-related enums.
 import enum
 
 
-class UserRole(str, enum.Enum):
-    """User roles in the system"""
+class UserRole(enum.IntEnum):
+    """
+    User roles in the system.
+    Backed by power-of-two integers so permission checks can use bitmasks. The integer
+    is what is stored in MongoDB; the string names (see as_str/from_str) are what is
+    put in tokens and returned by the API.
+    """
 
-    ADMIN = "admin"
-    INSTRUCTOR = "instructor"
-    STUDENT = "student"
+    ADMIN = 4
+    INSTRUCTOR = 2
+    STUDENT = 1
+
+    @classmethod
+    def from_str(cls, value: str) -> "UserRole":
+        """Get role from its string name (e.g. "student")"""
+        try:
+            return _STR_TO_ROLE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+    @classmethod
+    def coerce(cls, value: "str | int") -> "UserRole":
+        """Get role from either its stored integer or its string name"""
+        if isinstance(value, str):
+            return cls.from_str(value)
+        return cls(value)
+
+    def as_str(self) -> str:
+        """Get the string name of the role (e.g. "student")"""
+        return _ROLE_TO_STR[self]
+
+
+_ROLE_TO_STR: dict[UserRole, str] = {
+    UserRole.ADMIN: "admin",
+    UserRole.INSTRUCTOR: "instructor",
+    UserRole.STUDENT: "student",
+}
+_STR_TO_ROLE: dict[str, UserRole] = {name: role for role, name in _ROLE_TO_STR.items()}
@@ -2,21 +2,37 @@
 Comprehensive domain exceptions with error codes.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only details for exceptions raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _default_code(cls: type) -> str:
+    """Get default error code from class name"""
+    return cls.__name__.upper().replace("ERROR", "_ERROR")
+
 
 class DomainException(Exception):
     """Base exception for all domain errors"""
 
+    _DEFAULT_CODE: str
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Computed once per class instead of on every raise
+        cls._DEFAULT_CODE = _default_code(cls)
+
     def __init__(self, message: str, code: str = None, details: dict[str, Any] | None = None):
         self.message = message
-        self.code = code or self._get_default_code()
-        self.details = details or {}
+        self.code = code or type(self)._DEFAULT_CODE
+        self.details: Mapping[str, Any] = details if details is not None else _EMPTY_DETAILS
         super().__init__(self.message)
 
-    def _get_default_code(self) -> str:
-        """Get default error code from class name"""
-        return self.__class__.__name__.upper().replace("ERROR", "_ERROR")
+
+DomainException._DEFAULT_CODE = _default_code(DomainException)
 
 
 class ValidationError(DomainException):
@@ -1,4 +1,4 @@
-from .auth import AuthResponse, UserResponse
+from .auth import AuthResponse, TokenBundle, UserResponse
 from .errors import ErrorDetail, ErrorResponse
 
-__all__ = ["AuthResponse", "UserResponse", "ErrorResponse", "ErrorDetail"]
+__all__ = ["AuthResponse", "TokenBundle", "UserResponse", "ErrorResponse", "ErrorDetail"]
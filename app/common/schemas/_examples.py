@@ -0,0 +1,28 @@
+"""
+OpenAPI examples for the common response schemas.
+Kept out of the model modules so the large literals live in one place;
+models reference them by key.
+"""
+
+from pydantic.json_schema import JsonDict
+
+_USER_RESPONSE: JsonDict = {
+    "id": "507f1f77bcf86cd799439011",
+    "email": "user@example.com",
+    "phone": "+1234567890",
+    "role": "student",
+    "is_active": True,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+EXAMPLES: dict[str, JsonDict] = {
+    "user_response": _USER_RESPONSE,
+    "auth_response": {
+        "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "token_type": "bearer",
+        # Same object as the UserResponse example, not a copy
+        "user": _USER_RESPONSE,
+    },
+}
@@ -2,9 +2,23 @@
 Reusable authentication response schemas.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from app.common.enums.user import UserRole
+from app.common.schemas._examples import EXAMPLES
+from app.domain.user.entities.user import User
+
+
+@dataclass(slots=True)
+class TokenBundle:
+    """Access/refresh token pair issued by the auth use cases"""
+
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
 
 
 class UserResponse(BaseModel):
@@ -18,19 +32,24 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime | None = None
 
+    @field_validator("role", mode="before")
+    @classmethod
+    def role_name(cls, v):
+        """Accept UserRole members (e.g. from domain entities) as their string name"""
+        if isinstance(v, UserRole):
+            return v.as_str()
+        return v
+
+    @classmethod
+    def from_domain(cls, user: User) -> "UserResponse":
+        """Build from a domain User entity (read through from_attributes)"""
+        return cls.model_validate(user)
+
     model_config = ConfigDict(
         from_attributes=True,
-        json_schema_extra={
-            "example": {
-                "id": "507f1f77bcf86cd799439011",
-                "email": "user@example.com",
-                "phone": "+1234567890",
-                "role": "student",
-                "is_active": True,
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-            }
-        },
+        validate_assignment=False,
+        revalidate_instances="never",
+        json_schema_extra={"example": EXAMPLES["user_response"]},
     )
 
 
@@ -42,21 +61,18 @@ class AuthResponse(BaseModel):
     token_type: str = "bearer"
     user: UserResponse
 
+    @classmethod
+    def from_domain(cls, user: User, tokens: TokenBundle) -> "AuthResponse":
+        """Build from a domain User entity and the issued tokens"""
+        return cls(
+            access_token=tokens.access_token,
+            refresh_token=tokens.refresh_token,
+            token_type=tokens.token_type,
+            user=UserResponse.from_domain(user),
+        )
+
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "token_type": "bearer",
-                "user": {
-                    "id": "507f1f77bcf86cd799439011",
-                    "email": "user@example.com",
-                    "phone": "+1234567890",
-                    "role": "student",
-                    "is_active": True,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-01T00:00:00Z",
-                },
-            }
-        }
+        validate_assignment=False,
+        revalidate_instances="never",
+        json_schema_extra={"example": EXAMPLES["auth_response"]},
     )
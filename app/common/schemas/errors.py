@@ -1,14 +1,17 @@
 """
 Structured error response schemas.
+Built only by the exception handlers, so they are msgspec structs (no validation,
+encoded to JSON in C) rather than Pydantic models.
 """
 
-from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+import msgspec
 
+from app.common.utils.timestamps import utc_timestamp
 
-class ErrorDetail(BaseModel):
+
+class ErrorDetail(msgspec.Struct, kw_only=True):
     """Single error detail"""
 
     field: str | None = None
@@ -17,33 +20,21 @@ class ErrorDetail(BaseModel):
     value: Any | None = None
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(msgspec.Struct, kw_only=True):
     """Standard error response format"""
 
-    error: str = Field(..., description="Error type/class name")
-    message: str = Field(..., description="Human-readable error message")
-    code: str = Field(..., description="Error code for programmatic handling")
-    details: list[ErrorDetail] | None = Field(None, description="Detailed error information")
-    timestamp: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
-    path: str | None = Field(None, description="Request path")
-    trace_id: str | None = Field(None, description="Request trace ID for observability")
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "error": "ValidationError",
-                "message": "Email or phone is required",
-                "code": "VALIDATION_ERROR",
-                "details": [
-                    {
-                        "field": "email",
-                        "message": "Email is required when phone is not provided",
-                        "code": "REQUIRED_FIELD",
-                    }
-                ],
-                "timestamp": "2024-01-01T00:00:00Z",
-                "path": "/api/v1/auth/register",
-                "trace_id": "550e8400-e29b-41d4-a716-446655440000",
-            }
-        }
-    }
+    error: str  # Error type/class name
+    message: str  # Human-readable error message
+    code: str  # Error code for programmatic handling
+    details: list[ErrorDetail] | None = None  # Detailed error information
+    timestamp: str = msgspec.field(default_factory=utc_timestamp)
+    path: str | None = None  # Request path
+    trace_id: str | None = None  # Request trace ID for observability
+
+    def to_json(self) -> bytes:
+        """Encode response as JSON bytes"""
+        return _encoder.encode(self)
+
+
+# Unknown detail values (e.g. raw validation input) are encoded as strings
+_encoder = msgspec.json.Encoder(enc_hook=str)
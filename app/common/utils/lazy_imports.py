@@ -0,0 +1,46 @@
+"""
+Lazy package exports (PEP 562).
+Packages re-export names from their submodules, importing a submodule only when one of
+its names is first accessed.
+"""
+
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str, namespace: dict[str, Any], exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module __getattr__ and __dir__ for a package with lazy exports.
+
+    Usage (in a package __init__.py):
+        _LAZY = {"RegisterUseCase": "register"}
+        __all__ = list(_LAZY)
+        __getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
+
+    Args:
+        package: The package's __name__
+        namespace: The package's globals(); resolved names are cached there
+        exports: Exported name -> submodule (relative to the package) defining it
+
+    Returns:
+        (__getattr__, __dir__) for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        obj = getattr(import_module(f".{module_name}", package), name)
+        # Cache on the package so later lookups skip __getattr__
+        namespace[name] = obj
+        return obj
+
+    def __dir__() -> list[str]:
+        return [*namespace, *exports]
+
+    return __getattr__, __dir__
@@ -4,13 +4,20 @@ Structured logging configuration with trace ID support.
 
 import logging
 import sys
-from contextvars import ContextVar
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+from typing import Any
 
-from pythonjsonlogger import jsonlogger
+import orjson
+import structlog
+from structlog.typing import EventDict, Processor
 
 # Context variable for trace ID (accessible globally)
 trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
 
+# Returned by bind_trace_id: the trace_id_var token and structlog's binding tokens
+TraceIDTokens = tuple[Token[str | None], Mapping[str, Token[Any]]]
+
 
 def get_trace_id() -> str | None:
     """Get current trace ID from context"""
@@ -18,17 +25,47 @@ def get_trace_id() -> str | None:
 
 
 def set_trace_id(trace_id: str | None) -> None:
-    """Set trace ID in context"""
+    """Set trace ID in context (also bound to structlog's context for log events)"""
     trace_id_var.set(trace_id)
+    if trace_id is None:
+        structlog.contextvars.unbind_contextvars("trace_id")
+    else:
+        structlog.contextvars.bind_contextvars(trace_id=trace_id)
+
+
+def bind_trace_id(trace_id: str) -> TraceIDTokens:
+    """Set trace ID in context for a scope; undo with reset_trace_id(tokens)"""
+    return trace_id_var.set(trace_id), structlog.contextvars.bind_contextvars(trace_id=trace_id)
+
+
+def reset_trace_id(tokens: TraceIDTokens) -> None:
+    """Restore the trace ID (and structlog binding) that bind_trace_id replaced"""
+    var_token, structlog_tokens = tokens
+    trace_id_var.reset(var_token)
+    structlog.contextvars.reset_contextvars(**structlog_tokens)
 
 
-class TraceIDFilter(logging.Filter):
-    """Logging filter to add trace ID to log records"""
+def _add_static_fields(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Add service name and default trace ID to every log event"""
+    event_dict["service"] = "api"
+    event_dict.setdefault("trace_id", "N/A")
+    return event_dict
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add trace ID to log record"""
-        record.trace_id = get_trace_id() or "N/A"
-        return True
+
+def _orjson_serializer(obj: Any, **_: Any) -> str:
+    """JSON serializer for log events backed by orjson (C extension)"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def _render_text(logger: Any, method_name: str, event_dict: EventDict) -> str:
+    """Render a log event in the readable development format"""
+    line = (
+        f"{event_dict['timestamp']} | {event_dict['level'].upper():<8} | "
+        f"{event_dict['logger']} | [{event_dict['trace_id']}] | {event_dict['message']}"
+    )
+    if "exception" in event_dict:
+        line = f"{line}\n{event_dict['exception']}"
+    return line
 
 
 def setup_logging(log_level: str = "INFO", json_format: bool = True) -> None:
@@ -42,6 +79,42 @@ def setup_logging(log_level: str = "INFO", json_format: bool = True) -> None:
     # Convert string level to logging constant
     level = getattr(logging, log_level.upper(), logging.INFO)
 
+    # Processor chain built once and shared by stdlib and structlog loggers
+    shared_processors: list[Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.ExtraAdder(),
+        structlog.processors.TimeStamper(
+            fmt="iso" if json_format else "%Y-%m-%d %H:%M:%S", utc=json_format
+        ),
+        _add_static_fields,
+    ]
+
+    if json_format:
+        # JSON structured logging (for production/log aggregation)
+        renderer: Processor = structlog.processors.JSONRenderer(serializer=_orjson_serializer)
+    else:
+        # Standard readable format (for development)
+        renderer = _render_text
+
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            structlog.processors.EventRenamer("message"),
+            renderer,
+        ],
+    )
+
+    structlog.configure(
+        processors=[*shared_processors, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
     # Create root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -52,41 +125,6 @@ def setup_logging(log_level: str = "INFO", json_format: bool = True) -> None:
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(level)
-
-    # Add trace ID filter
-    handler.addFilter(TraceIDFilter())
-
-    # Configure formatter
-    if json_format:
-        # JSON structured logging (for production/log aggregation)
-        class JsonFormatterWithTraceID(jsonlogger.JsonFormatter):
-            """JSON formatter with trace ID support"""
-
-            def format(self, record):
-                # Add trace_id to record before formatting
-                if not hasattr(record, "trace_id"):
-                    record.trace_id = get_trace_id() or "N/A"
-                return super().format(record)
-
-        formatter = JsonFormatterWithTraceID(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s %(trace_id)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            rename_fields={
-                "asctime": "timestamp",
-                "name": "logger",
-                "levelname": "level",
-                "message": "message",
-                "trace_id": "trace_id",
-            },
-            static_fields={"service": "api"},
-        )
-    else:
-        # Standard readable format (for development)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s | %(levelname)-8s | %(name)s | [%(trace_id)s] | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
     handler.setFormatter(formatter)
     root_logger.addHandler(handler)
 
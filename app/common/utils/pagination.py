@@ -5,7 +5,8 @@ Pagination utilities and response models.
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, model_validator
 
 T = TypeVar("T")
 
@@ -18,17 +19,18 @@ class PaginationParams(BaseModel):
     skip: int | None = None
     limit: int | None = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Calculate skip/limit from page/page_size if not provided
+    @model_validator(mode="after")
+    def fill_skip_and_limit(self):
+        """Calculate skip/limit from page/page_size if not provided"""
         if self.skip is None:
             self.skip = (self.page - 1) * self.page_size
         if self.limit is None:
             self.limit = self.page_size
+        return self
 
 
-class PaginationMeta(BaseModel):
-    """Pagination metadata for frontend"""
+class PaginationMeta(msgspec.Struct):
+    """Pagination metadata for frontend (built internally, so no validation)"""
 
     total: int
     page: int
@@ -0,0 +1,22 @@
+"""
+UTC timestamp helpers.
+"""
+
+import time
+from datetime import UTC, datetime
+
+# (epoch millisecond, ISO string) of the most recently generated timestamp
+_last_timestamp: tuple[int, str] = (0, "")
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO string, memoized at millisecond granularity"""
+    global _last_timestamp
+    ms = time.time_ns() // 1_000_000
+    cached_ms, cached_iso = _last_timestamp
+    if ms == cached_ms:
+        return cached_iso
+    # Fixed millisecond precision (isoformat() drops the fraction on whole seconds)
+    iso = datetime.fromtimestamp(ms / 1000, UTC).isoformat(timespec="milliseconds")
+    _last_timestamp = (ms, iso)
+    return iso
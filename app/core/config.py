@@ -1,8 +1,10 @@
-from functools import lru_cache
-
-from pydantic import field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Lowest Argon2 costs accepted in production (OWASP password storage guidance)
+ARGON2_MIN_TIME_COST = 2
+ARGON2_MIN_MEMORY_COST = 19456  # KiB (19MiB)
+
 
 class Settings(BaseSettings):
     # App
@@ -52,12 +54,19 @@ class Settings(BaseSettings):
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database_name: str = "app_db"
     mongodb_pool_size: int = 10
+    mongodb_min_pool_size: int = 0
+    mongodb_wait_queue_timeout_ms: int = 1000  # Fail fast when the pool is exhausted
+    mongodb_max_idle_time_ms: int = 60000
+    mongodb_compressors: str = "zstd,zlib"  # Wire compression, in order of preference
 
     # Security
     secret_key: str = "dev-secret-key-change-in-production-min-32-characters-long"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    argon2_time_cost: int = Field(default=2, ge=1)  # Argon2 iterations
+    argon2_memory_cost: int = Field(default=65536, ge=8)  # Argon2 memory per hash, KiB (64MB)
+    argon2_pool_workers: int = 2  # Argon2 hashing processes per app worker
 
     # CORS
     cors_origins: str | list[str] = "*"  # Comma-separated string or JSON array
@@ -65,11 +74,14 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
     redis_max_connections: int = 10
+    redis_min_connections: int = 1  # Connections opened (pre-warmed) at startup
+    redis_health_check_interval: int = 30  # Seconds idle before a connection is re-checked
 
     # Rate Limiting
     rate_limit_enabled: bool = True
     rate_limit_default: str = "1000/hour"  # Global default rate limit for all endpoints
     rate_limit_storage: str = "memory://"  # Use "redis://localhost:6379" in production
+    rate_limit_headers_enabled: bool = True  # X-RateLimit-* headers (extra storage reads)
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
@@ -79,6 +91,22 @@ class Settings(BaseSettings):
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     log_json_format: bool = False  # Use JSON structured logging (False for readable dev logs)
 
+    # Health check
+    health_cache_ttl: float = 10.0  # Seconds to serve cached /health results (0 disables)
+
+    @model_validator(mode="after")
+    def check_production_argon2_costs(self):
+        """Reject Argon2 costs below the OWASP minimum (t=2, m=19MiB) in production"""
+        if self.environment == "production" and (
+            self.argon2_time_cost < ARGON2_MIN_TIME_COST
+            or self.argon2_memory_cost < ARGON2_MIN_MEMORY_COST
+        ):
+            raise ValueError(
+                f"ARGON2_TIME_COST must be >= {ARGON2_MIN_TIME_COST} and ARGON2_MEMORY_COST "
+                f">= {ARGON2_MIN_MEMORY_COST} in production"
+            )
+        return self
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -88,6 +116,9 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+# Process-wide settings singleton
+SETTINGS: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return SETTINGS
@@ -1,24 +1,12 @@
 """
 Auth domain module.
-Contains auth-specific use cases.
+Contains auth-specific use cases (re-exported lazily from .use_cases).
 """
 
-from .use_cases.change_password import ChangePasswordUseCase
-from .use_cases.deactivate_account import DeactivateAccountUseCase
-from .use_cases.get_current_user import GetCurrentUserUseCase
-from .use_cases.login import LoginUseCase
-from .use_cases.logout import LogoutUseCase
-from .use_cases.refresh_token import RefreshTokenUseCase
-from .use_cases.register import RegisterUseCase
-from .use_cases.update_profile import UpdateProfileUseCase
+from app.common.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    "RegisterUseCase",
-    "LoginUseCase",
-    "RefreshTokenUseCase",
-    "GetCurrentUserUseCase",
-    "UpdateProfileUseCase",
-    "ChangePasswordUseCase",
-    "DeactivateAccountUseCase",
-    "LogoutUseCase",
-]
+from . import use_cases as _use_cases
+
+__all__ = _use_cases.__all__
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), dict.fromkeys(__all__, "use_cases"))
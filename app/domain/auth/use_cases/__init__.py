@@ -1,24 +1,23 @@
 """
 Auth use cases.
 All business operations for authentication domain.
+Use cases are imported lazily (PEP 562) so only the ones referenced get loaded.
 """
 
-from .change_password import ChangePasswordUseCase
-from .deactivate_account import DeactivateAccountUseCase
-from .get_current_user import GetCurrentUserUseCase
-from .login import LoginUseCase
-from .logout import LogoutUseCase
-from .refresh_token import RefreshTokenUseCase
-from .register import RegisterUseCase
-from .update_profile import UpdateProfileUseCase
+from app.common.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    "RegisterUseCase",
-    "LoginUseCase",
-    "RefreshTokenUseCase",
-    "GetCurrentUserUseCase",
-    "UpdateProfileUseCase",
-    "ChangePasswordUseCase",
-    "DeactivateAccountUseCase",
-    "LogoutUseCase",
-]
+# Use case name -> submodule defining it
+_LAZY = {
+    "RegisterUseCase": "register",
+    "LoginUseCase": "login",
+    "RefreshTokenUseCase": "refresh_token",
+    "GetCurrentUserUseCase": "get_current_user",
+    "UpdateProfileUseCase": "update_profile",
+    "ChangePasswordUseCase": "change_password",
+    "DeactivateAccountUseCase": "deactivate_account",
+    "LogoutUseCase": "logout",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
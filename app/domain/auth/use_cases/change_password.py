@@ -4,7 +4,12 @@ Change password use case.
 
 from app.common.exceptions import NotFoundError, UnauthorizedError, ValidationError
 from app.domain.user.types.repository import IUserRepository
-from app.infrastructure.security.password import hash_password, verify_password
+from app.infrastructure.security.password import (
+    PASSWORD_MAX_LENGTH,
+    PASSWORD_MIN_LENGTH,
+    hash_password_async,
+    verify_password_async,
+)
 
 
 class ChangePasswordUseCase:
@@ -28,9 +33,10 @@ class ChangePasswordUseCase:
             ValidationError: If validation fails
         """
         # Validate new password
-        if not new_password or len(new_password) < 8:
+        if not new_password or not PASSWORD_MIN_LENGTH <= len(new_password) <= PASSWORD_MAX_LENGTH:
             raise ValidationError(
-                "New password must be at least 8 characters", field="new_password"
+                f"New password must be {PASSWORD_MIN_LENGTH}-{PASSWORD_MAX_LENGTH} characters",
+                field="new_password",
             )
 
         # Get user with password - we need email or phone to get password
@@ -51,11 +57,11 @@ class ChangePasswordUseCase:
         _, current_hash = result
 
         # Verify current password
-        if not verify_password(current_password, current_hash):
+        if not await verify_password_async(current_password, current_hash):
             raise UnauthorizedError("Current password is incorrect")
 
         # Hash new password
-        new_password_hash = hash_password(new_password)
+        new_password_hash = await hash_password_async(new_password)
 
         # Update password in database
         await self.repository.update_password(user_id, new_password_hash)
@@ -3,10 +3,11 @@ Login user use case.
 """
 
 from app.common.exceptions import UnauthorizedError, ValidationError
+from app.common.schemas import TokenBundle
 from app.domain.user.entities.user import User
 from app.domain.user.types.repository import IUserRepository
 from app.infrastructure.security.jwt import create_access_token, create_refresh_token
-from app.infrastructure.security.password import verify_password
+from app.infrastructure.security.password import verify_dummy_password_async, verify_password_async
 
 
 class LoginUseCase:
@@ -17,7 +18,7 @@ class LoginUseCase:
 
     async def execute(
         self, email: str | None = None, phone: str | None = None, password: str = ""
-    ) -> tuple[User, dict[str, str]]:
+    ) -> tuple[User, TokenBundle]:
         """
         Login user and return user + tokens.
 
@@ -27,7 +28,7 @@ class LoginUseCase:
             password: User password
 
         Returns:
-            Tuple of (User entity, tokens dict with access_token, refresh_token, token_type)
+            Tuple of (User entity, TokenBundle with access_token, refresh_token, token_type)
 
         Raises:
             ValidationError: If email or phone not provided
@@ -45,12 +46,14 @@ class LoginUseCase:
             result = await self.repository.get_by_phone_with_password(phone)
 
         if not result:
+            # Same Argon2 cost as a wrong password, so unknown users can't be told apart
+            await verify_dummy_password_async(password)
             raise UnauthorizedError("Invalid credentials")
 
         user, password_hash = result
 
         # Verify password
-        if not verify_password(password, password_hash):
+        if not await verify_password_async(password, password_hash):
             raise UnauthorizedError("Invalid credentials")
 
         # Check if account is active
@@ -58,13 +61,7 @@ class LoginUseCase:
             raise UnauthorizedError("Account is deactivated")
 
         # Generate JWT tokens
-        access_token = create_access_token(user.id, user.role.value)
+        access_token = create_access_token(user.id, user.role.as_str())
         refresh_token = create_refresh_token(user.id)
 
-        tokens = {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "token_type": "bearer",
-        }
-
-        return user, tokens
+        return user, TokenBundle(access_token=access_token, refresh_token=refresh_token)
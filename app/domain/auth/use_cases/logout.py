@@ -1,49 +1,56 @@
 """
 Logout use case.
 
-Note: In a stateless JWT architecture, logout is typically handled client-side
-by removing the token. If token blacklisting is required, implement a token
-blacklist service (e.g., Redis) and add tokens to it here.
+Tokens are revoked in Redis (see app.infrastructure.security.revocation); revoked
+access tokens are rejected by the auth dependency and revoked refresh tokens by
+the refresh use case. Clients should still discard their tokens.
 """
 
+import asyncio
+
 from app.common.exceptions import UnauthorizedError
-from app.infrastructure.security.jwt import decode_token
+from app.infrastructure.security.jwt import decode_token, get_subject
+from app.infrastructure.security.revocation import revoke_token
 
 
 class LogoutUseCase:
     """
     Use case for user logout.
 
-    In a stateless JWT system, logout is handled client-side by discarding tokens.
-    This use case validates the token format. For token blacklisting, implement
-    a blacklist service (Redis recommended) and add tokens here.
+    Validates the token (and the refresh token, if given) and revokes them.
+    Revocation is best effort: if Redis is unavailable the tokens stay valid until
+    they expire.
     """
 
-    async def execute(self, token: str) -> None:
+    async def execute(self, token: str, refresh_token: str | None = None) -> None:
         """
-        Logout user (validate token format).
+        Logout user (validate and revoke tokens).
 
         Args:
-            token: Access token to validate
+            token: Access or refresh token to revoke
+            refresh_token: Refresh token of the same user to revoke as well, so it can't
+                mint new tokens after logout
 
         Raises:
-            UnauthorizedError: If token is invalid or expired
+            UnauthorizedError: If a token is invalid or expired, or the refresh token
+                belongs to another user
         """
         # Validate token format and expiration
         payload = decode_token(token)
         if not payload:
             raise UnauthorizedError("Invalid or expired token")
 
-        # In a stateless JWT system, logout is handled client-side.
-        # The client should discard the token.
-        #
-        # If token blacklisting is required:
-        # 1. Implement a token blacklist service (Redis recommended)
-        # 2. Add token to blacklist with TTL matching token expiration
-        # 3. Check blacklist in JWT validation middleware
-        #
-        # Example:
-        # await blacklist_service.add(token, ttl=settings.access_token_expire_minutes * 60)
-
-        # Token is valid - logout successful (client should discard token)
-        return
+        if refresh_token is None:
+            await revoke_token(payload)
+            return
+
+        refresh_payload = decode_token(refresh_token)
+        if (
+            not refresh_payload
+            or refresh_payload.get("type") != "refresh"
+            or get_subject(refresh_payload) is None
+            or get_subject(refresh_payload) != get_subject(payload)
+        ):
+            raise UnauthorizedError("Invalid or expired refresh token")
+
+        await asyncio.gather(revoke_token(payload), revoke_token(refresh_payload))
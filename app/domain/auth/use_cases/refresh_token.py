@@ -3,8 +3,15 @@ Refresh token use case.
 """
 
 from app.common.exceptions import UnauthorizedError
+from app.common.schemas import TokenBundle
 from app.domain.user.types.repository import IUserRepository
-from app.infrastructure.security.jwt import create_access_token, create_refresh_token, decode_token
+from app.infrastructure.security.jwt import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    get_subject,
+)
+from app.infrastructure.security.revocation import is_token_revoked
 
 
 class RefreshTokenUseCase:
@@ -13,7 +20,7 @@ class RefreshTokenUseCase:
     def __init__(self, user_repository: IUserRepository):
         self.repository = user_repository
 
-    async def execute(self, refresh_token: str) -> dict[str, str]:
+    async def execute(self, refresh_token: str) -> TokenBundle:
         """
         Refresh access token.
 
@@ -21,7 +28,7 @@ class RefreshTokenUseCase:
             refresh_token: Refresh token
 
         Returns:
-            Dict with access_token, refresh_token, token_type
+            TokenBundle with access_token, refresh_token, token_type
 
         Raises:
             UnauthorizedError: If token is invalid or user not found/inactive
@@ -36,24 +43,27 @@ class RefreshTokenUseCase:
         if payload.get("type") != "refresh":
             raise UnauthorizedError("Invalid token type")
 
+        # Reject tokens revoked on logout
+        if await is_token_revoked(payload):
+            raise UnauthorizedError("Token has been revoked")
+
         # Extract user ID
-        user_id = str(payload.get("sub"))
+        user_id = get_subject(payload)
+        if user_id is None:
+            raise UnauthorizedError("Invalid refresh token")
 
-        # Fetch user to get current role and verify account is still active
-        user = await self.repository.get_by_id(user_id)
+        # Fetch only current role and active flag (not the full user document)
+        result = await self.repository.get_active_role_by_id(user_id)
 
-        if not user:
+        if not result:
             raise UnauthorizedError("User not found")
 
-        if not user.is_active:
+        role, is_active = result
+        if not is_active:
             raise UnauthorizedError("Account is deactivated")
 
         # Generate new tokens with current role
-        new_access_token = create_access_token(user_id, user.role.value)
+        new_access_token = create_access_token(user_id, role.as_str())
         new_refresh_token = create_refresh_token(user_id)
 
-        return {
-            "access_token": new_access_token,
-            "refresh_token": new_refresh_token,
-            "token_type": "bearer",
-        }
+        return TokenBundle(access_token=new_access_token, refresh_token=new_refresh_token)
@@ -7,7 +7,11 @@ from app.common.exceptions import ValidationError
 from app.domain.user.entities.user import User
 from app.domain.user.types.repository import IUserRepository
 from app.domain.user.use_cases.create_user import CreateUserUseCase
-from app.infrastructure.security.password import hash_password
+from app.infrastructure.security.password import (
+    PASSWORD_MAX_LENGTH,
+    PASSWORD_MIN_LENGTH,
+    hash_password_async,
+)
 
 
 class RegisterUseCase:
@@ -31,15 +35,18 @@ class RegisterUseCase:
             User entity
 
         Raises:
-            ValidationError: If password is empty
+            ValidationError: If password is empty or its length is out of range
             ConflictError: If user already exists
         """
         # Validate password
-        if not password or len(password) < 8:
-            raise ValidationError("Password must be at least 8 characters", field="password")
+        if not password or not PASSWORD_MIN_LENGTH <= len(password) <= PASSWORD_MAX_LENGTH:
+            raise ValidationError(
+                f"Password must be {PASSWORD_MIN_LENGTH}-{PASSWORD_MAX_LENGTH} characters",
+                field="password",
+            )
 
         # Hash password using Argon2
-        password_hash = hash_password(password)
+        password_hash = await hash_password_async(password)
 
         # Create user via user use case
         return await self.create_user.execute(
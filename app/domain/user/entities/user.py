@@ -9,7 +9,7 @@ from datetime import datetime
 from app.common.enums.user import UserRole
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User domain entity.
@@ -21,12 +21,16 @@ class User:
     phone: str | None
     role: UserRole
     is_active: bool
-    created_at: datetime
+    created_at: datetime | None  # None until persisted
     updated_at: datetime | None
 
+    # Role bitmasks for permission checks (class attributes, not fields)
+    _CREATE_COURSE_MASK = UserRole.INSTRUCTOR.value | UserRole.ADMIN.value
+    _MANAGE_ANY_COURSE_MASK = UserRole.ADMIN.value
+
     def can_create_course(self) -> bool:
         """Business rule: only instructors and admins can create courses"""
-        return self.role in [UserRole.INSTRUCTOR, UserRole.ADMIN]
+        return bool(self.role & self._CREATE_COURSE_MASK)
 
     def can_enroll(self) -> bool:
         """Business rule: only students can enroll in courses"""
@@ -34,7 +38,7 @@ class User:
 
     def can_manage_course(self, course_owner_id: str) -> bool:
         """Business rule: can manage course if owner or admin"""
-        return self.id == course_owner_id or self.role == UserRole.ADMIN
+        return self.id == course_owner_id or bool(self.role & self._MANAGE_ANY_COURSE_MASK)
 
     def is_admin(self) -> bool:
         """Check if user is admin"""
@@ -2,57 +2,66 @@
 User repository interface.
 Defines the contract for user data access operations.
 Implementation is in infrastructure layer.
+Structural (typing.Protocol): implementations don't need to inherit from it.
 """
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
+from app.common.enums.user import UserRole
 from app.domain.user.entities.user import User
 
 
-class IUserRepository(ABC):
+class IUserRepository(Protocol):
     """Interface for user repository operations"""
 
-    @abstractmethod
     async def create(self, user: User, password_hash: str = "") -> User:
-        """Create a new user"""
-        pass
+        """Create a new user (raises ConflictError if email/phone is already taken)"""
+        ...
 
-    @abstractmethod
     async def get_by_id(self, user_id: str) -> User | None:
         """Get user by ID"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_phone(self, phone: str) -> User | None:
         """Get user by phone"""
-        pass
+        ...
+
+    async def find_by_email_or_phone(
+        self, email: str | None = None, phone: str | None = None
+    ) -> User | None:
+        """Get a user matching either email or phone in one query"""
+        ...
 
-    @abstractmethod
     async def get_by_email_with_password(self, email: str) -> tuple[User, str] | None:
         """Get user by email with password hash for authentication"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_phone_with_password(self, phone: str) -> tuple[User, str] | None:
         """Get user by phone with password hash for authentication"""
-        pass
+        ...
 
-    @abstractmethod
     async def update(self, user: User) -> User:
         """Update user"""
-        pass
+        ...
+
+    async def update_profile_by_id(
+        self, user_id: str, email: str | None = None, phone: str | None = None
+    ) -> User | None:
+        """Update user email/phone in one operation, None if user not found"""
+        ...
+
+    async def get_active_role_by_id(self, user_id: str) -> tuple[UserRole, bool] | None:
+        """Get only (role, is_active) of a user, None if user not found"""
+        ...
 
-    @abstractmethod
     async def update_password(self, user_id: str, password_hash: str) -> bool:
         """Update user password"""
-        pass
+        ...
 
-    @abstractmethod
     async def deactivate(self, user: User) -> User:
         """Deactivate user (soft delete)"""
-        pass
+        ...
@@ -1,18 +1,21 @@
 """
 User use cases.
 All business operations for user domain.
+Use cases are imported lazily (PEP 562) so only the ones referenced get loaded.
 """
 
-from .create_user import CreateUserUseCase
-from .deactivate_user import DeactivateUserUseCase
-from .get_user import GetUserByEmailUseCase, GetUserByIdUseCase, GetUserByPhoneUseCase
-from .update_user import UpdateUserUseCase
+from app.common.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    "CreateUserUseCase",
-    "GetUserByIdUseCase",
-    "GetUserByEmailUseCase",
-    "GetUserByPhoneUseCase",
-    "UpdateUserUseCase",
-    "DeactivateUserUseCase",
-]
+# Use case name -> submodule defining it
+_LAZY = {
+    "CreateUserUseCase": "create_user",
+    "GetUserByIdUseCase": "get_user",
+    "GetUserByEmailUseCase": "get_user",
+    "GetUserByPhoneUseCase": "get_user",
+    "UpdateUserUseCase": "update_user",
+    "DeactivateUserUseCase": "deactivate_user",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
@@ -2,8 +2,6 @@
 Create user use case.
 """
 
-from datetime import datetime
-
 from app.common.enums.user import UserRole
 from app.common.exceptions import ConflictError, ValidationError
 from app.domain.user.entities.user import User
@@ -47,20 +45,16 @@ class CreateUserUseCase:
                 details={"email": email, "phone": phone},
             )
 
-        # Check if user already exists
-        if email:
-            existing = await self.repository.get_by_email(email)
-            if existing:
+        # Check if user already exists (single query for both identifiers)
+        existing = await self.repository.find_by_email_or_phone(email=email, phone=phone)
+        if existing:
+            if email and existing.email == email:
                 raise ConflictError(
                     "User with this email already exists", resource="user", details={"email": email}
                 )
-
-        if phone:
-            existing = await self.repository.get_by_phone(phone)
-            if existing:
-                raise ConflictError(
-                    "User with this phone already exists", resource="user", details={"phone": phone}
-                )
+            raise ConflictError(
+                "User with this phone already exists", resource="user", details={"phone": phone}
+            )
 
         # Create user entity
         user = User(
@@ -69,9 +63,9 @@ class CreateUserUseCase:
             phone=phone,
             role=role,
             is_active=True,
-            created_at=datetime.now(),
+            created_at=None,  # Stamped by the repository on insert
             updated_at=None,
         )
 
-        # Save via repository
+        # Save via repository (unique indexes catch concurrent registrations)
         return await self.repository.create(user, password_hash)
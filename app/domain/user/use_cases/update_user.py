@@ -2,8 +2,6 @@
 Update user use case.
 """
 
-from datetime import datetime
-
 from app.domain.user.entities.user import User
 from app.domain.user.types.repository import IUserRepository
 
@@ -41,10 +39,7 @@ class UpdateUserUseCase:
         if role is not None:
             from app.common.enums.user import UserRole
 
-            user.role = UserRole(role)
-
-        # Update timestamp
-        user.updated_at = datetime.now()
+            user.role = UserRole.from_str(role)
 
-        # Save via repository
+        # Save via repository (stamps updated_at)
         return await self.repository.update(user)
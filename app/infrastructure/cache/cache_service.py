@@ -3,14 +3,21 @@ Cache service for application-level caching operations.
 Provides a high-level API for caching with automatic serialization.
 """
 
-import json
+import asyncio
+import contextlib
+import fnmatch
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import timedelta
 from functools import wraps
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
+import msgspec
+import orjson
 from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
 
 from app.infrastructure.cache.redis_client import redis_client
 
@@ -18,16 +25,50 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Pub/Sub channel used to invalidate local (L1) cache entries across workers
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Backoff between invalidation listener reconnect attempts (seconds)
+_LISTENER_BACKOFF_INITIAL = 0.5
+_LISTENER_BACKOFF_MAX = 30.0
+
+_MISSING = object()
+
+Serializer = Literal["json", "msgpack"]
+
+# MessagePack codec for compact values (IntEnum -> int, aware datetimes -> timestamp ext)
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=str)
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
 
 class CacheService:
     """
-    High-level caching service with JSON serialization.
-    Gracefully handles Redis unavailability.
+    High-level caching service with JSON serialization (orjson), or MessagePack
+    for smaller payloads. Gracefully handles Redis unavailability.
+
+    Values read from Redis are also kept in a small in-process LRU (L1) for
+    local_ttl seconds, or until the Redis entry expires if that is sooner. set/delete
+    publish an invalidation so other workers drop their L1 copy. L1 is only used
+    while the invalidation listener is subscribed; if the subscription drops, L1 is
+    cleared and bypassed until the listener reconnects. L1 values are shared
+    objects, so callers must not mutate them.
     """
 
-    def __init__(self, redis: Redis | None = None, prefix: str = "app"):
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        prefix: str = "app",
+        local_maxsize: int = 4096,
+        local_ttl: float = 5.0,
+    ):
         self._redis = redis
         self._prefix = prefix
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._local_maxsize = local_maxsize
+        self._local_ttl = local_ttl
+        self._listener_task: asyncio.Task | None = None
+        # True only while subscribed to invalidations (see _listen_for_invalidations)
+        self._local_enabled = False
 
     @property
     def redis(self) -> Redis | None:
@@ -38,20 +79,158 @@ class CacheService:
         """Create prefixed cache key"""
         return f"{self._prefix}:{key}"
 
-    async def get(self, key: str) -> Any | None:
+    @staticmethod
+    def _dumps(value: Any, serializer: Serializer) -> bytes:
+        """Serialize a value for Redis"""
+        if serializer == "msgpack":
+            return _msgpack_encoder.encode(value)
+        # Dataclasses are serialized natively; naive datetimes are treated as UTC
+        return orjson.dumps(value, default=str, option=orjson.OPT_NAIVE_UTC)
+
+    @staticmethod
+    def _loads(value: bytes, serializer: Serializer) -> Any:
+        """Deserialize a value read from Redis"""
+        if serializer == "msgpack":
+            return _msgpack_decoder.decode(value)
+        return orjson.loads(value)
+
+    def _local_get(self, full_key: str) -> Any:
+        """Get value from L1, _MISSING if absent or expired"""
+        entry = self._local.get(full_key)
+        if entry is None:
+            return _MISSING
+        expires, value = entry
+        if expires < time.monotonic():
+            self._local.pop(full_key, None)
+            return _MISSING
+        self._local.move_to_end(full_key)
+        return value
+
+    def _local_set(self, full_key: str, value: Any, ttl: float | None = None) -> None:
+        """
+        Store value in L1, evicting the least recently used entry when full.
+        ttl is the Redis entry's remaining lifetime (None if it has no expiry).
+        """
+        local_ttl = self._local_ttl if ttl is None else min(self._local_ttl, ttl)
+        self._local[full_key] = (time.monotonic() + local_ttl, value)
+        self._local.move_to_end(full_key)
+        if len(self._local) > self._local_maxsize:
+            self._local.popitem(last=False)
+
+    def _local_invalidate(self, key_or_pattern: str) -> None:
+        """Drop an L1 entry (or all entries matching a glob pattern)"""
+        if any(c in key_or_pattern for c in "*?["):
+            for full_key in [k for k in self._local if fnmatch.fnmatchcase(k, key_or_pattern)]:
+                self._local.pop(full_key, None)
+        else:
+            self._local.pop(key_or_pattern, None)
+
+    async def _publish_invalidation(self, key_or_pattern: str) -> None:
+        """Invalidate locally and tell other workers to do the same"""
+        self._local_invalidate(key_or_pattern)
+        if not self.redis:
+            return
+        try:
+            await self.redis.publish(INVALIDATION_CHANNEL, key_or_pattern)
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish error for {key_or_pattern}: {e}")
+
+    async def start_invalidation_listener(self) -> None:
+        """Subscribe to L1 invalidations (call once Redis is connected)"""
+        if not self.redis or self._listener_task is not None:
+            return
+
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+        self._listener_task = asyncio.create_task(self._listen_for_invalidations(pubsub))
+
+    async def stop_invalidation_listener(self) -> None:
+        """Stop the L1 invalidation listener"""
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
+
+    async def _listen_for_invalidations(self, pubsub) -> None:
+        """
+        Apply invalidation messages published by any worker.
+        If the subscription drops (Redis restart, connection error), L1 is disabled
+        and the listener resubscribes with exponential backoff.
+        """
+        backoff = _LISTENER_BACKOFF_INITIAL
+        while True:
+            try:
+                if pubsub is None:
+                    redis = self.redis
+                    if redis is None:
+                        raise ConnectionError("Redis client is not connected")
+                    pubsub = redis.pubsub()
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._local_invalidate(message["data"])
+                    elif message["type"] == "subscribe":
+                        # Subscribed from here on; anything published before is lost
+                        self._local.clear()
+                        self._local_enabled = True
+                        backoff = _LISTENER_BACKOFF_INITIAL
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener lost, retrying in {backoff}s: {e}")
+            finally:
+                # Without invalidations L1 can't be trusted; bypass it until resubscribed
+                self._local_enabled = False
+                self._local.clear()
+                if pubsub is not None:
+                    with contextlib.suppress(Exception):
+                        await pubsub.aclose()
+                    pubsub = None
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _LISTENER_BACKOFF_MAX)
+
+    async def get(self, key: str, serializer: Serializer = "json") -> Any | None:
         """
         Get value from cache.
         Returns None if key doesn't exist or Redis unavailable.
+
+        Args:
+            key: Cache key
+            serializer: Format the value was stored with ("json" or "msgpack")
         """
         if not self.redis:
             return None
 
+        full_key = self._make_key(key)
+        if self._local_enabled:
+            local = self._local_get(full_key)
+            if local is not _MISSING:
+                return local
+
         try:
-            full_key = self._make_key(key)
-            value = await self.redis.get(full_key)
-            if value:
-                return json.loads(value)
-            return None
+            # Read raw bytes (the client decodes responses to str by default)
+            if not self._local_enabled:
+                value = await self.redis.execute_command("GET", full_key, **{NEVER_DECODE: True})
+                return self._loads(value, serializer) if value else None
+
+            # Same round-trip: the remaining TTL, so the L1 copy never outlives the entry
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.execute_command("GET", full_key, **{NEVER_DECODE: True})
+            pipe.pttl(full_key)
+            value, pttl = await pipe.execute()
+            if not value:
+                return None
+
+            decoded = self._loads(value, serializer)
+            # PTTL is -1 for no expiry, -2 if the key expired right after the GET
+            if self._local_enabled and pttl != -2:
+                self._local_set(full_key, decoded, None if pttl == -1 else pttl / 1000)
+            return decoded
         except Exception as e:
             logger.warning(f"Cache get error for {key}: {e}")
             return None
@@ -62,6 +241,8 @@ class CacheService:
         value: Any,
         ttl: int | None = None,
         ttl_timedelta: timedelta | None = None,
+        nx: bool = False,
+        serializer: Serializer = "json",
     ) -> bool:
         """
         Set value in cache with optional TTL.
@@ -71,16 +252,19 @@ class CacheService:
             value: Value to cache (will be JSON serialized)
             ttl: Time to live in seconds
             ttl_timedelta: Time to live as timedelta
+            nx: Only set if the key doesn't exist yet (first writer wins)
+            serializer: "msgpack" stores a smaller binary payload; read it back
+                with get(key, serializer="msgpack")
 
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (or if nx and the key already existed)
         """
         if not self.redis:
             return False
 
         try:
             full_key = self._make_key(key)
-            serialized = json.dumps(value, default=str)
+            serialized = self._dumps(value, serializer)
 
             expire_seconds = None
             if ttl_timedelta:
@@ -88,12 +272,11 @@ class CacheService:
             elif ttl:
                 expire_seconds = ttl
 
-            if expire_seconds:
-                await self.redis.setex(full_key, expire_seconds, serialized)
-            else:
-                await self.redis.set(full_key, serialized)
-
-            return True
+            # Single SET [EX] [NX] command
+            stored = bool(await self.redis.set(full_key, serialized, ex=expire_seconds, nx=nx))
+            if stored:
+                await self._publish_invalidation(full_key)
+            return stored
         except Exception as e:
             logger.warning(f"Cache set error for {key}: {e}")
             return False
@@ -106,6 +289,7 @@ class CacheService:
         try:
             full_key = self._make_key(key)
             await self.redis.delete(full_key)
+            await self._publish_invalidation(full_key)
             return True
         except Exception as e:
             logger.warning(f"Cache delete error for {key}: {e}")
@@ -121,13 +305,14 @@ class CacheService:
 
         try:
             full_pattern = self._make_key(pattern)
-            keys = []
+            # Queue deletes while scanning, then send them in one round-trip
+            pipe = self.redis.pipeline(transaction=False)
             async for key in self.redis.scan_iter(match=full_pattern):
-                keys.append(key)
+                pipe.delete(key)
 
-            if keys:
-                return await self.redis.delete(*keys)
-            return 0
+            results = await pipe.execute()
+            await self._publish_invalidation(full_pattern)
+            return sum(results)
         except Exception as e:
             logger.warning(f"Cache delete_pattern error for {pattern}: {e}")
             return 0
@@ -210,6 +395,9 @@ def cached(
     key_prefix: str,
     ttl: int = 300,
     key_builder: Callable[..., str] | None = None,
+    nx: bool = False,
+    serializer: Serializer = "json",
+    version: int | None = None,
 ):
     """
     Decorator for caching function results.
@@ -218,13 +406,24 @@ def cached(
         key_prefix: Prefix for cache key
         ttl: Time to live in seconds (default: 5 minutes)
         key_builder: Optional function to build cache key from args
+        nx: Cache with SET NX so concurrent misses don't overwrite the first result
+        serializer: Storage format ("json" or the more compact "msgpack")
+        version: Schema version added to the key; bump it when the cached shape
+            changes so old entries are never decoded
 
     Example:
         @cached("user", ttl=60)
         async def get_user(user_id: str) -> User:
             ...
+
+        @cached("user", ttl=60, serializer="msgpack", version=1)
+        async def get_user_compact(user_id: str) -> User:
+            ...
     """
 
+    if version is not None:
+        key_prefix = f"{key_prefix}:v{version}"
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
@@ -233,13 +432,21 @@ def cached(
             # Build cache key
             if key_builder:
                 key = f"{key_prefix}:{key_builder(*args, **kwargs)}"
+            elif not kwargs:
+                # Fast paths for positional-only calls (same keys as the general path)
+                if len(args) == 1:
+                    key = f"{key_prefix}:{args[0]}"
+                elif args:
+                    key = f"{key_prefix}:{':'.join(map(str, args))}"
+                else:
+                    key = key_prefix
             else:
                 # Default: use all args as key
                 key_parts = [str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())]
-                key = f"{key_prefix}:{':'.join(key_parts)}" if key_parts else key_prefix
+                key = f"{key_prefix}:{':'.join(key_parts)}"
 
             # Try cache
-            cached_value = await cache.get(key)
+            cached_value = await cache.get(key, serializer=serializer)
             if cached_value is not None:
                 logger.debug(f"Cache hit: {key}")
                 return cached_value
@@ -247,7 +454,7 @@ def cached(
             # Compute and cache
             logger.debug(f"Cache miss: {key}")
             result = await func(*args, **kwargs)
-            await cache.set(key, result, ttl=ttl)
+            await cache.set(key, result, ttl=ttl, nx=nx, serializer=serializer)
             return result
 
         return wrapper
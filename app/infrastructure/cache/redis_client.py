@@ -2,6 +2,7 @@
 Redis client configuration and connection management.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -25,21 +26,31 @@ class RedisClient:
         self._client: Redis | None = None
         self._pool: redis.ConnectionPool | None = None
 
-    async def connect(self) -> None:
-        """Initialize Redis connection pool"""
+    async def connect(self, min_size: int | None = None, max_size: int | None = None) -> None:
+        """
+        Initialize Redis connection pool.
+
+        Args:
+            min_size: Connections to open at startup (default: settings.redis_min_connections)
+            max_size: Pool size limit (default: settings.redis_max_connections)
+        """
         if self._client is not None:
             return
 
+        max_size = max_size or settings.redis_max_connections
+        min_size = min(max(min_size or settings.redis_min_connections, 1), max_size)
+
         try:
             self._pool = redis.ConnectionPool.from_url(
                 self.url,
-                max_connections=settings.redis_max_connections,
+                max_connections=max_size,
+                health_check_interval=settings.redis_health_check_interval,
                 decode_responses=True,
             )
             self._client = Redis(connection_pool=self._pool)
 
-            # Test connection
-            await self._client.ping()
+            # Test connection (concurrent pings open and pre-warm min_size connections)
+            await asyncio.gather(*(self._client.ping() for _ in range(min_size)))
             logger.info(f"Redis connected: {self._mask_url(self.url)}")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Caching disabled.")
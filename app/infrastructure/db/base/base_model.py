@@ -12,6 +12,9 @@ class BaseMongoModel(BaseModel):
     """
     Abstract base model with common fields.
     All MongoDB models should inherit from this.
+
+    Validation runs on the write path only; repositories hydrate documents read
+    from MongoDB with model_construct (see BaseRepository._dict_to_model).
     """
 
     model_config = ConfigDict(
@@ -4,16 +4,58 @@ Similar structure to SQL base_repository.py but using Motor/MongoDB queries.
 """
 
 from abc import ABC
-from datetime import datetime
-from typing import Any, Generic, TypeVar
+from datetime import UTC, datetime
+from functools import lru_cache
+from types import GenericAlias
+from typing import Any, Generic, TypeVar, cast
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pydantic import BaseModel, TypeAdapter
+from pymongo import ReturnDocument, UpdateOne
 
 from app.common.utils.pagination import PaginatedResponse, PaginationParams
 
 # TypeVar for generic repository pattern
-ModelType = TypeVar("ModelType")
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_ID_FIELD: set[str] = {"id"}
+
+
+def _utcnow() -> datetime:
+    """Current UTC time, naive like the datetimes MongoDB returns (utcnow() is deprecated)"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=8192)
+def _object_id(id: str) -> ObjectId:
+    """Parse a hex id into an ObjectId (cached, since hot ids repeat; raises InvalidId)"""
+    return ObjectId(id)
+
+
+def _oid(id: str) -> ObjectId | None:
+    """Parse a hex id into an ObjectId, None if it is not a valid id"""
+    # ObjectId(None) would generate a fresh id, so only strings are parsed
+    if not isinstance(id, str):
+        return None
+    try:
+        return _object_id(id)
+    except InvalidId:
+        return None
+
+
+def _update_document(update_data: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """
+    Build the update operators for update_data, stamping updated_at.
+    None fields are unset, not stored (sparse unique indexes skip missing fields but not nulls).
+    """
+    to_set = {field: value for field, value in update_data.items() if value is not None}
+    to_set["updated_at"] = now
+    to_unset = {field: "" for field, value in update_data.items() if value is None}
+    if to_unset:
+        return {"$set": to_set, "$unset": to_unset}
+    return {"$set": to_set}
 
 
 class BaseRepository(ABC, Generic[ModelType]):
@@ -24,9 +66,21 @@ class BaseRepository(ABC, Generic[ModelType]):
         class UserRepository(BaseRepository[User]):
             def __init__(self):
                 super().__init__("users", User)
+
+    Documents read back are trusted (they were validated on write) and are
+    hydrated with model_construct. Set validate_documents = True on a repository
+    to run full validation instead (batched through one TypeAdapter for lists).
     """
 
-    def __init__(self, collection_name: str, model_class: type):
+    validate_documents: bool = False
+
+    # Fields returned by reads when the caller passes no projection (None = whole document)
+    DEFAULT_PROJECTION: dict[str, int] | None = None
+
+    # Largest cursor batch requested; pages up to this size come back in one batch
+    BATCH_SIZE_HINT: int = 1000
+
+    def __init__(self, collection_name: str, model_class: type[ModelType]):
         """
         Initialize repository with collection name and model class.
 
@@ -36,24 +90,31 @@ class BaseRepository(ABC, Generic[ModelType]):
         """
         self.collection_name = collection_name
         self.model_class = model_class
-
-    def _get_collection(self, db: AsyncIOMotorDatabase):
-        """Get MongoDB collection"""
-        return db[self.collection_name]
+        self._construct = model_class.model_construct
+        # Collection handle for the last database seen (Motor builds a new one per lookup)
+        self._collection_cache: tuple[AsyncIOMotorDatabase, AsyncIOMotorCollection] | None = None
+        self._list_adapter: TypeAdapter[list[ModelType]] | None = None
+
+    def _get_collection(self, db: AsyncIOMotorDatabase) -> AsyncIOMotorCollection:
+        """Get MongoDB collection (cached per database instance)"""
+        cached = self._collection_cache
+        if cached is not None and cached[0] is db:
+            return cached[1]
+        collection = db[self.collection_name]
+        self._collection_cache = (db, collection)
+        return collection
+
+    def _projection(self, projection: dict[str, int] | None) -> dict[str, int] | None:
+        """Resolve the projection for a read (explicit, else the class default)"""
+        return projection if projection is not None else self.DEFAULT_PROJECTION
 
     def _to_dict(self, obj: ModelType, exclude_id: bool = False) -> dict[str, Any]:
-        """Convert model to dictionary"""
-        if hasattr(obj, "model_dump"):
-            data = obj.model_dump()
-        elif hasattr(obj, "dict"):
-            data = obj.dict()
-        else:
-            data = dict(obj)
-
-        # Remove id field as MongoDB uses _id
-        if exclude_id and "id" in data or "id" in data:
-            data.pop("id")
-        return data
+        """
+        Convert model to dictionary.
+        None fields are omitted (sparse unique indexes skip missing fields but not nulls).
+        """
+        # MongoDB uses _id, so callers writing new documents drop the model's id
+        return obj.model_dump(exclude=_ID_FIELD if exclude_id else None, exclude_none=True)
 
     async def create(self, db: AsyncIOMotorDatabase, obj: ModelType) -> ModelType:
         """
@@ -68,30 +129,90 @@ class BaseRepository(ABC, Generic[ModelType]):
         """
         collection = self._get_collection(db)
         data = self._to_dict(obj, exclude_id=True)
-        data["created_at"] = datetime.utcnow()
+        data["created_at"] = _utcnow()
         data["updated_at"] = None
 
         result = await collection.insert_one(data)
-        created = await collection.find_one({"_id": result.inserted_id})
-        return self._dict_to_model(created)
+        # The stored document is known locally; no need to read it back
+        data["_id"] = result.inserted_id
+        return self._hydrate(data)
+
+    async def bulk_create(self, db: AsyncIOMotorDatabase, objs: list[ModelType]) -> list[ModelType]:
+        """
+        Create many documents in one insert_many round-trip.
+
+        Args:
+            db: Database instance
+            objs: Model instances to create
+
+        Returns:
+            Created model instances with generated _id (in input order)
+
+        Raises:
+            BulkWriteError: If any insert fails (the others are still written, ordered=False)
+        """
+        if not objs:
+            return []
+
+        now = _utcnow()
+        docs = []
+        for obj in objs:
+            data = self._to_dict(obj, exclude_id=True)
+            data["created_at"] = now
+            data["updated_at"] = None
+            docs.append(data)
+
+        collection = self._get_collection(db)
+        # insert_many sets _id on each dict, so the models come from the local documents
+        await collection.insert_many(docs, ordered=False)
+        return self._docs_to_models(docs)
+
+    async def bulk_update(
+        self, db: AsyncIOMotorDatabase, updates: dict[str, dict[str, Any]]
+    ) -> int:
+        """
+        Update many documents in one bulk_write round-trip.
+
+        Args:
+            db: Database instance
+            updates: Mapping of document _id to the fields to set (None values are unset)
+
+        Returns:
+            Number of documents modified (invalid ids are skipped)
+        """
+        now = _utcnow()
+        operations = []
+        for id, update_data in updates.items():
+            oid = _oid(id)
+            if oid is not None:
+                operations.append(UpdateOne({"_id": oid}, _update_document(update_data, now)))
+        if not operations:
+            return 0
+
+        collection = self._get_collection(db)
+        result = await collection.bulk_write(operations, ordered=False)
+        return result.modified_count
 
-    async def get_by_id(self, db: AsyncIOMotorDatabase, id: str) -> ModelType | None:
+    async def get_by_id(
+        self, db: AsyncIOMotorDatabase, id: str, projection: dict[str, int] | None = None
+    ) -> ModelType | None:
         """
         Get a document by its _id.
 
         Args:
             db: Database instance
             id: Document _id (string)
+            projection: Fields to return (default: DEFAULT_PROJECTION)
 
         Returns:
             Model instance if found, None otherwise
         """
-        collection = self._get_collection(db)
-        try:
-            doc = await collection.find_one({"_id": ObjectId(id)})
-            return self._dict_to_model(doc) if doc else None
-        except Exception:
+        oid = _oid(id)
+        if oid is None:
             return None
+        collection = self._get_collection(db)
+        doc = await collection.find_one({"_id": oid}, self._projection(projection))
+        return self._dict_to_model(doc)
 
     async def get_all(
         self,
@@ -99,6 +220,7 @@ class BaseRepository(ABC, Generic[ModelType]):
         skip: int = 0,
         limit: int = 100,
         filter_dict: dict[str, Any] | None = None,
+        projection: dict[str, int] | None = None,
     ) -> list[ModelType]:
         """
         Get all documents with pagination.
@@ -108,29 +230,78 @@ class BaseRepository(ABC, Generic[ModelType]):
             skip: Number of documents to skip
             limit: Maximum number of documents to return
             filter_dict: Optional filter dictionary
+            projection: Fields to return (default: DEFAULT_PROJECTION)
 
         Returns:
             List of model instances
         """
         collection = self._get_collection(db)
         filter_dict = filter_dict or {}
-        cursor = collection.find(filter_dict).skip(skip).limit(limit)
-        docs = await cursor.to_list(length=limit)
-        return [self._dict_to_model(doc) for doc in docs]
+        cursor = (
+            collection.find(filter_dict, self._projection(projection))
+            .skip(skip)
+            .limit(limit)
+            .batch_size(min(limit, self.BATCH_SIZE_HINT))
+        )
+        if self.validate_documents:
+            return self._docs_to_models(await cursor.to_list(length=limit))
+
+        # Hydrate while iterating instead of materializing the raw documents first
+        construct, prepare = self._construct, self._prepare_doc
+        return [construct(**prepare(doc)) async for doc in cursor]
+
+    async def get_page_with_count(
+        self,
+        db: AsyncIOMotorDatabase,
+        skip: int = 0,
+        limit: int = 100,
+        filter_dict: dict[str, Any] | None = None,
+        projection: dict[str, int] | None = None,
+    ) -> tuple[list[ModelType], int]:
+        """
+        Get one page of documents and the total match count in a single aggregation ($facet).
+        A limit of 0 returns every match after skip, as it does for find().
+
+        Returns:
+            Tuple of (model instances, total count)
+        """
+        items_stages: list[dict[str, Any]] = [{"$skip": skip}]
+        # $limit must be positive, so "no limit" is expressed by leaving the stage out
+        if limit > 0:
+            items_stages.append({"$limit": limit})
+        projection = self._projection(projection)
+        if projection:
+            items_stages.append({"$project": projection})
+
+        pipeline = [
+            {"$match": filter_dict or {}},
+            {"$facet": {"items": items_stages, "total": [{"$count": "n"}]}},
+        ]
+        collection = self._get_collection(db)
+        results = await collection.aggregate(pipeline).to_list(1)
+        if not results:
+            return [], 0
+        result = results[0]
+        total = result["total"][0]["n"] if result["total"] else 0
+        return self._docs_to_models(result["items"]), total
 
     async def get_all_paginated(
         self,
         db: AsyncIOMotorDatabase,
         pagination: PaginationParams,
         filter_dict: dict[str, Any] | None = None,
+        projection: dict[str, int] | None = None,
     ) -> PaginatedResponse[ModelType]:
         """
         Get all documents with pagination and metadata.
-        Similar to SQL version.
+        Similar to SQL version (page and count fetched in one round-trip).
         """
-        total = await self.count(db, filter_dict)
-        items = await self.get_all(
-            db, skip=pagination.skip, limit=pagination.limit, filter_dict=filter_dict
+        items, total = await self.get_page_with_count(
+            db,
+            skip=pagination.skip or 0,
+            limit=pagination.page_size if pagination.limit is None else pagination.limit,
+            filter_dict=filter_dict,
+            projection=projection,
         )
 
         from app.common.utils.pagination import PaginationMeta
@@ -145,7 +316,24 @@ class BaseRepository(ABC, Generic[ModelType]):
         self, db: AsyncIOMotorDatabase, id: str, update_data: dict[str, Any]
     ) -> ModelType | None:
         """
-        Update a document.
+        Update a document (single findAndModify round-trip).
+
+        Args:
+            db: Database instance
+            id: Document _id
+            update_data: Dictionary with fields to update
+
+        Returns:
+            Updated model instance, None if not found
+        """
+        return await self.find_one_and_update(db, id, update_data)
+
+    async def find_one_and_update(
+        self, db: AsyncIOMotorDatabase, id: str, update_data: dict[str, Any]
+    ) -> ModelType | None:
+        """
+        Update a document and return it in a single round-trip.
+        None values are unset rather than stored, as on create.
 
         Args:
             db: Database instance
@@ -153,17 +341,40 @@ class BaseRepository(ABC, Generic[ModelType]):
             update_data: Dictionary with fields to update
 
         Returns:
-            Updated model instance
+            Updated model instance, None if not found
         """
+        oid = _oid(id)
+        if oid is None:
+            return None
         collection = self._get_collection(db)
-        update_data["updated_at"] = datetime.utcnow()
 
-        result = await collection.update_one({"_id": ObjectId(id)}, {"$set": update_data})
+        doc = await collection.find_one_and_update(
+            {"_id": oid},
+            _update_document(update_data, _utcnow()),
+            projection=self._projection(None),
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._dict_to_model(doc)
 
-        if result.modified_count:
-            updated = await collection.find_one({"_id": ObjectId(id)})
-            return self._dict_to_model(updated)
-        return None
+    async def get_fields_by_id(
+        self, db: AsyncIOMotorDatabase, id: str, fields: list[str]
+    ) -> dict[str, Any] | None:
+        """
+        Get only the given fields of a document by its _id (projection).
+
+        Args:
+            db: Database instance
+            id: Document _id (string)
+            fields: Field names to return
+
+        Returns:
+            Raw document with only the requested fields, None if not found
+        """
+        oid = _oid(id)
+        if oid is None:
+            return None
+        collection = self._get_collection(db)
+        return await collection.find_one({"_id": oid}, {field: 1 for field in fields})
 
     async def delete(self, db: AsyncIOMotorDatabase, id: str) -> bool:
         """
@@ -176,18 +387,21 @@ class BaseRepository(ABC, Generic[ModelType]):
         Returns:
             True if deleted, False if not found
         """
-        collection = self._get_collection(db)
-        try:
-            result = await collection.delete_one({"_id": ObjectId(id)})
-            return result.deleted_count > 0
-        except Exception:
+        oid = _oid(id)
+        if oid is None:
             return False
+        collection = self._get_collection(db)
+        result = await collection.delete_one({"_id": oid})
+        return result.deleted_count > 0
 
     async def count(
         self, db: AsyncIOMotorDatabase, filter_dict: dict[str, Any] | None = None
     ) -> int:
         """
         Count documents.
+        Without a filter the count comes from collection metadata
+        (estimated_document_count): O(1), but it can lag briefly after writes
+        and, on sharded clusters, include orphaned documents.
 
         Args:
             db: Database instance
@@ -197,15 +411,43 @@ class BaseRepository(ABC, Generic[ModelType]):
             Total count
         """
         collection = self._get_collection(db)
-        filter_dict = filter_dict or {}
+        if not filter_dict:
+            return await collection.estimated_document_count()
         return await collection.count_documents(filter_dict)
 
+    def _prepare_doc(self, doc: dict[str, Any]) -> dict[str, Any]:
+        """
+        Normalize a raw document in place before hydration.
+        Override to convert stored representations that validators would otherwise handle.
+        """
+        # Convert _id to id
+        if "_id" in doc:
+            doc["id"] = str(doc.pop("_id"))
+        return doc
+
+    def _hydrate(self, doc: dict[str, Any]) -> ModelType:
+        """Convert a MongoDB document to a model instance"""
+        doc = self._prepare_doc(doc)
+        if self.validate_documents:
+            return self.model_class(**doc)
+        return self._construct(**doc)
+
     def _dict_to_model(self, doc: dict[str, Any] | None) -> ModelType | None:
-        """Convert MongoDB document to model instance"""
+        """Convert MongoDB document to model instance (None if there is no document)"""
         if not doc:
             return None
-        # Convert _id to id
-        if "_id" in doc:
-            doc["id"] = str(doc["_id"])
-            doc.pop("_id")
-        return self.model_class(**doc)
+        return self._hydrate(doc)
+
+    def _docs_to_models(self, docs: list[dict[str, Any]]) -> list[ModelType]:
+        """Convert a batch of MongoDB documents to model instances"""
+        prepare = self._prepare_doc
+        if not self.validate_documents:
+            construct = self._construct
+            return [construct(**prepare(doc)) for doc in docs]
+
+        docs = [prepare(doc) for doc in docs]
+        if self._list_adapter is None:
+            # list[self.model_class] is not a valid type expression; build the alias at runtime
+            list_type = cast(type[list[ModelType]], GenericAlias(list, (self.model_class,)))
+            self._list_adapter = TypeAdapter(list_type)
+        return self._list_adapter.validate_python(docs)
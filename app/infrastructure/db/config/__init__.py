@@ -1,5 +1,6 @@
-from .database import close_db, get_client, get_database, get_db, init_db
-from .session import AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .database import check_database_connection, close_db, get_client, get_database, get_db, init_db
 
 __all__ = [
     "get_db",
@@ -7,5 +8,6 @@ __all__ = [
     "get_database",
     "init_db",
     "close_db",
+    "check_database_connection",
     "AsyncIOMotorDatabase",
 ]
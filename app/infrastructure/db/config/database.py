@@ -6,6 +6,7 @@ Similar structure to SQL database.py but using Motor (async MongoDB driver).
 import logging
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
 from pymongo.errors import ServerSelectionTimeoutError
 
 from app.core.config import get_settings
@@ -23,10 +24,22 @@ def get_client() -> AsyncIOMotorClient:
     global client
     if client is None:
         mongodb_url = settings.mongodb_url
+        options = {}
+        if settings.mongodb_compressors:
+            # Negotiated with the server; falls back to uncompressed if none match
+            options["compressors"] = settings.mongodb_compressors
+            options["zlibCompressionLevel"] = 3
         client = AsyncIOMotorClient(
             mongodb_url,
             serverSelectionTimeoutMS=5000,
             maxPoolSize=settings.mongodb_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            retryReads=True,
+            retryWrites=True,
+            uuidRepresentation="standard",
+            **options,
         )
     return client
 
@@ -75,10 +88,16 @@ async def init_db():
 
             # Create indexes
             db = get_database()
-            # User collection indexes
-            await db.users.create_index("email", unique=True, sparse=True)
-            await db.users.create_index("phone", unique=True, sparse=True)
-            await db.users.create_index("created_at")
+            # User collection indexes (one createIndexes command)
+            await db.users.create_indexes(
+                [
+                    IndexModel("email", unique=True, sparse=True),
+                    IndexModel("phone", unique=True, sparse=True),
+                    IndexModel("created_at"),
+                    # get_by_role*: {role, is_active}
+                    IndexModel([("is_active", ASCENDING), ("role", ASCENDING)]),
+                ]
+            )
 
             logger.info("MongoDB: Indexes initialized successfully")
         except Exception as e:
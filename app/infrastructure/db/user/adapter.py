@@ -4,36 +4,41 @@ Converts between MongoDB models and domain entities.
 This is infrastructure concern - adapting infrastructure to domain.
 """
 
-from datetime import datetime
+from typing import final
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
 from app.common.enums.user import UserRole
+from app.common.exceptions import ConflictError
 from app.domain.user.entities.user import User as UserEntity
-from app.domain.user.types.repository import IUserRepository
 from app.infrastructure.db.user.model import User as UserModel
 from app.infrastructure.db.user.repository import UserRepository as InfraUserRepository
 
 
-class UserRepositoryAdapter(IUserRepository):
-    """Adapter that implements IUserRepository using infrastructure repository"""
+@final
+class UserRepositoryAdapter:
+    """Adapter that implements IUserRepository (structurally) using infrastructure repository"""
 
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self._repo = InfraUserRepository()
 
-    def _model_to_entity(self, model: UserModel) -> UserEntity | None:
+    def _model_to_entity(self, model: UserModel | None) -> UserEntity | None:
         """Convert MongoDB model to domain entity"""
         if not model:
             return None
+        # Read the field values directly; the repository already converted the role
+        d = model.__dict__
+        role = d["role"]
         return UserEntity(
-            id=model.id,
-            email=model.email,
-            phone=model.phone,
-            role=UserRole(model.role.value) if model.role else UserRole.STUDENT,
-            is_active=model.is_active,
-            created_at=model.created_at or datetime.utcnow(),
-            updated_at=model.updated_at,
+            id=d["id"],
+            email=d["email"],
+            phone=d["phone"],
+            role=role if isinstance(role, UserRole) else UserRole.coerce(role),
+            is_active=d["is_active"],
+            created_at=d["created_at"],
+            updated_at=d["updated_at"],
         )
 
     def _entity_to_model(self, entity: UserEntity, password_hash: str = "") -> UserModel:
@@ -52,7 +57,16 @@ class UserRepositoryAdapter(IUserRepository):
     async def create(self, user: UserEntity, password_hash: str = "") -> UserEntity:
         """Create a new user"""
         model = self._entity_to_model(user, password_hash)
-        created = await self._repo.create(self.db, model)
+        try:
+            created = await self._repo.create(self.db, model)
+        except DuplicateKeyError as e:
+            # Lost a race with a concurrent registration using the same identifier
+            field = next(iter((e.details or {}).get("keyPattern", {})), "email")
+            raise ConflictError(
+                f"User with this {field} already exists",
+                resource="user",
+                details={field: getattr(user, field, None)},
+            ) from e
         return self._model_to_entity(created)
 
     async def get_by_id(self, user_id: str) -> UserEntity | None:
@@ -70,6 +84,13 @@ class UserRepositoryAdapter(IUserRepository):
         model = await self._repo.get_by_phone(self.db, phone)
         return self._model_to_entity(model)
 
+    async def find_by_email_or_phone(
+        self, email: str | None = None, phone: str | None = None
+    ) -> UserEntity | None:
+        """Get a user matching either email or phone in one query"""
+        model = await self._repo.find_by_email_or_phone(self.db, email=email, phone=phone)
+        return self._model_to_entity(model)
+
     async def get_by_email_with_password(self, email: str) -> tuple[UserEntity, str] | None:
         """Get user by email with password hash for authentication"""
         model = await self._repo.get_by_email(self.db, email)
@@ -97,13 +118,12 @@ class UserRepositoryAdapter(IUserRepository):
         if not model:
             raise ValueError("User not found")
 
-        # Update fields
+        # Update fields (a None email/phone is unset, keeping the sparse unique indexes valid)
         update_data = {
             "email": user.email,
             "phone": user.phone,
             "role": user.role.value,
             "is_active": user.is_active,
-            "updated_at": user.updated_at or datetime.utcnow(),
         }
 
         updated = await self._repo.update(self.db, user.id, update_data)
@@ -111,6 +131,17 @@ class UserRepositoryAdapter(IUserRepository):
             raise ValueError("Failed to update user")
         return self._model_to_entity(updated)
 
+    async def update_profile_by_id(
+        self, user_id: str, email: str | None = None, phone: str | None = None
+    ) -> UserEntity | None:
+        """Update user email/phone in one operation"""
+        updated = await self._repo.update_profile(self.db, user_id, email=email, phone=phone)
+        return self._model_to_entity(updated)
+
+    async def get_active_role_by_id(self, user_id: str) -> tuple[UserRole, bool] | None:
+        """Get only (role, is_active) of a user"""
+        return await self._repo.get_role_and_status(self.db, user_id)
+
     async def update_password(self, user_id: str, password_hash: str) -> bool:
         """Update user password"""
         updated = await self._repo.update(self.db, user_id, {"password_hash": password_hash})
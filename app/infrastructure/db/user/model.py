@@ -3,7 +3,7 @@ User MongoDB model using Pydantic.
 Similar to SQL User model but for MongoDB.
 """
 
-from pydantic import Field
+from pydantic import Field, field_serializer, field_validator
 
 from app.common.enums.user import UserRole
 from app.infrastructure.db.base.base_model import BaseMongoModel
@@ -21,5 +21,18 @@ class User(BaseMongoModel):
     role: UserRole = Field(default=UserRole.STUDENT)
     is_active: bool = Field(default=True)
 
+    @field_validator("role", mode="before")
+    @classmethod
+    def parse_role(cls, v):
+        """Roles are stored as integers; documents written before that hold the name"""
+        if isinstance(v, str):
+            return UserRole.from_str(v)
+        return v
+
+    @field_serializer("role")
+    def serialize_role(self, role: UserRole) -> int:
+        """Store roles as plain integers (smaller documents than the name)"""
+        return role.value
+
     def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, role={self.role.value})>"
+        return f"<User(id={self.id}, email={self.email}, role={self.role.as_str()})>"
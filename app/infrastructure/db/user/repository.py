@@ -3,14 +3,43 @@ User repository for MongoDB.
 Similar structure to SQL UserRepository.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.common.enums.user import UserRole
 from app.common.utils.pagination import PaginatedResponse, PaginationParams
 from app.infrastructure.db.base.base_repository import BaseRepository
 from app.infrastructure.db.user.model import User
 
+# Filters below are shared between calls; PyMongo only reads them, never mutate them
+_ACTIVE_FILTER: dict[str, Any] = {"is_active": True}
+
+
+def _active_filter(search: str | None) -> dict[str, Any]:
+    """Active users, optionally matching email or phone (case-insensitive partial match)"""
+    if not search:
+        return _ACTIVE_FILTER
+    return {
+        **_ACTIVE_FILTER,
+        "$or": [
+            {"email": {"$regex": search, "$options": "i"}},
+            {"phone": {"$regex": search, "$options": "i"}},
+        ],
+    }
+
+
+@lru_cache(maxsize=16)
+def _active_role_filter(role: str) -> dict[str, Any]:
+    """Active users with a role stored either as integer or (older documents) by name"""
+    try:
+        roles = [UserRole.from_str(role).value, role]
+    except ValueError:
+        # Not a known role: match the name only, so lookups return no users instead of raising
+        roles = [role]
+    return {"role": {"$in": roles}, **_ACTIVE_FILTER}
+
 
 class UserRepository(BaseRepository[User]):
     """
@@ -18,19 +47,54 @@ class UserRepository(BaseRepository[User]):
     Extends BaseRepository with common CRUD + user-specific methods.
     """
 
+    # Model fields only (skips any extra fields a document may carry)
+    DEFAULT_PROJECTION = {
+        "email": 1,
+        "phone": 1,
+        "password_hash": 1,
+        "role": 1,
+        "is_active": 1,
+        "created_at": 1,
+        "updated_at": 1,
+    }
+
     def __init__(self):
         super().__init__("users", User)
 
+    def _prepare_doc(self, doc: dict[str, Any]) -> dict[str, Any]:
+        """Convert the stored role (int, or name in older documents) to UserRole"""
+        doc = super()._prepare_doc(doc)
+        role = doc.get("role")
+        if role is not None:
+            doc["role"] = UserRole.coerce(role)
+        return doc
+
     async def get_by_email(self, db: AsyncIOMotorDatabase, email: str) -> User | None:
         """Get user by email"""
         collection = self._get_collection(db)
-        doc = await collection.find_one({"email": email})
+        doc = await collection.find_one({"email": email}, self.DEFAULT_PROJECTION)
         return self._dict_to_model(doc)
 
     async def get_by_phone(self, db: AsyncIOMotorDatabase, phone: str) -> User | None:
         """Get user by phone"""
         collection = self._get_collection(db)
-        doc = await collection.find_one({"phone": phone})
+        doc = await collection.find_one({"phone": phone}, self.DEFAULT_PROJECTION)
+        return self._dict_to_model(doc)
+
+    async def find_by_email_or_phone(
+        self, db: AsyncIOMotorDatabase, email: str | None = None, phone: str | None = None
+    ) -> User | None:
+        """Get user matching email or phone with a single $or query"""
+        conditions = []
+        if email:
+            conditions.append({"email": email})
+        if phone:
+            conditions.append({"phone": phone})
+        if not conditions:
+            return None
+
+        collection = self._get_collection(db)
+        doc = await collection.find_one({"$or": conditions}, self.DEFAULT_PROJECTION)
         return self._dict_to_model(doc)
 
     async def get_by_email_or_phone(
@@ -43,6 +107,34 @@ class UserRepository(BaseRepository[User]):
             return await self.get_by_phone(db, phone)
         return None
 
+    async def update_profile(
+        self,
+        db: AsyncIOMotorDatabase,
+        user_id: str,
+        email: str | None = None,
+        phone: str | None = None,
+    ) -> User | None:
+        """Update email/phone (only those provided) and return the updated user"""
+        update_data: dict[str, Any] = {}
+        if email is not None:
+            update_data["email"] = email
+        if phone is not None:
+            update_data["phone"] = phone
+        return await self.find_one_and_update(db, user_id, update_data)
+
+    async def get_role_and_status(
+        self, db: AsyncIOMotorDatabase, user_id: str
+    ) -> tuple[UserRole, bool] | None:
+        """Get only (role, is_active) of a user"""
+        doc = await self.get_fields_by_id(db, user_id, ["role", "is_active"])
+        if not doc:
+            return None
+        role = doc.get("role")
+        return (
+            UserRole.coerce(role) if role else UserRole.STUDENT,
+            doc.get("is_active", True),
+        )
+
     async def deactivate(self, db: AsyncIOMotorDatabase, user_id: str) -> User | None:
         """Soft delete user (set is_active to False)"""
         return await self.update(db, user_id, {"is_active": False})
@@ -63,14 +155,7 @@ class UserRepository(BaseRepository[User]):
             limit: Maximum number of documents to return
             search: Optional search term to filter by email or phone (case-insensitive partial match)
         """
-        filter_dict: dict[str, Any] = {"is_active": True}
-
-        # Add search filter if provided
-        if search:
-            filter_dict["$or"] = [
-                {"email": {"$regex": search, "$options": "i"}},
-                {"phone": {"$regex": search, "$options": "i"}},
-            ]
+        filter_dict = _active_filter(search)
 
         return await self.get_all(db, skip=skip, limit=limit or 100, filter_dict=filter_dict)
 
@@ -88,14 +173,7 @@ class UserRepository(BaseRepository[User]):
             pagination: Pagination parameters
             search: Optional search term to filter by email or phone (case-insensitive partial match)
         """
-        filter_dict: dict[str, Any] = {"is_active": True}
-
-        # Add search filter if provided
-        if search:
-            filter_dict["$or"] = [
-                {"email": {"$regex": search, "$options": "i"}},
-                {"phone": {"$regex": search, "$options": "i"}},
-            ]
+        filter_dict = _active_filter(search)
 
         return await self.get_all_paginated(db, pagination, filter_dict=filter_dict)
 
@@ -116,38 +194,31 @@ class UserRepository(BaseRepository[User]):
             limit: Maximum number of documents to return
             search: Optional search term to filter by email or phone (case-insensitive partial match)
         """
-        filter_dict: dict[str, Any] = {"is_active": True}
-
-        # Add search filter if provided
-        if search:
-            filter_dict["$or"] = [
-                {"email": {"$regex": search, "$options": "i"}},
-                {"phone": {"$regex": search, "$options": "i"}},
-            ]
+        filter_dict = _active_filter(search)
 
-        total = await self.count(db, filter_dict)
-        items = await self.get_all_active(db, skip=skip, limit=limit, search=search)
-        return items, total
+        return await self.get_page_with_count(
+            db, skip=skip, limit=100 if limit is None else limit, filter_dict=filter_dict
+        )
 
     async def get_by_role(
         self, db: AsyncIOMotorDatabase, role: str, skip: int = 0, limit: int | None = None
     ) -> list[User]:
         """Get users by role"""
-        filter_dict = {"role": role, "is_active": True}
+        filter_dict = _active_role_filter(role)
         return await self.get_all(db, skip=skip, limit=limit or 100, filter_dict=filter_dict)
 
     async def get_by_role_paginated(
         self, db: AsyncIOMotorDatabase, role: str, pagination: PaginationParams
     ) -> PaginatedResponse[User]:
         """Get users by role with pagination"""
-        filter_dict = {"role": role, "is_active": True}
+        filter_dict = _active_role_filter(role)
         return await self.get_all_paginated(db, pagination, filter_dict=filter_dict)
 
     async def get_by_role_with_count(
         self, db: AsyncIOMotorDatabase, role: str, skip: int = 0, limit: int | None = None
     ) -> tuple[list[User], int]:
         """Get users by role with total count"""
-        filter_dict = {"role": role, "is_active": True}
-        total = await self.count(db, filter_dict)
-        items = await self.get_by_role(db, role, skip=skip, limit=limit)
-        return items, total
+        filter_dict = _active_role_filter(role)
+        return await self.get_page_with_count(
+            db, skip=skip, limit=100 if limit is None else limit, filter_dict=filter_dict
+        )
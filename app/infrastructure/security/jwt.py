@@ -2,43 +2,102 @@
 JWT token utilities for encoding and decoding tokens.
 """
 
-from datetime import UTC, datetime, timedelta
+import hashlib
+import time
+import uuid
 
 import jwt
+import orjson
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Verified payloads keyed by a digest of the token (raw bearer tokens are not kept in
+# memory), so repeated tokens skip signature verification. Only tokens with an exp claim
+# are cached, and entries are dropped once expired; oldest entries are evicted first when
+# full. Callers get a copy, so they cannot change a cached payload. Revocation is checked
+# separately.
+_decode_cache: dict[bytes, dict] = {}
+_DECODE_CACHE_MAX_SIZE = 4096
+
+# Encoder/decoder, key, algorithms and lifetimes resolved once instead of on every call
+_jwt = jwt.PyJWT()
+_jws = jwt.PyJWS()
+_SECRET_KEY = settings.secret_key
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+_ACCESS_TOKEN_TTL = settings.access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL = settings.refresh_token_expire_days * 86400
+
+
+def _encode(payload: dict) -> str:
+    """Sign a payload whose claims are already JSON-native (int timestamps)"""
+    return _jws.encode(orjson.dumps(payload), _SECRET_KEY, algorithm=_ALGORITHM)
+
 
 def create_access_token(user_id: str, role: str) -> str:
     """Create JWT access token"""
-    expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
-    payload = {"sub": str(user_id), "role": role, "type": "access", "exp": expire}
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm)
+    now = int(time.time())
+    payload = {
+        "sub": str(user_id),
+        "role": role,
+        "type": "access",
+        "jti": uuid.uuid4().hex,
+        "iat": now,
+        "exp": now + _ACCESS_TOKEN_TTL,
+    }
+    return _encode(payload)
 
 
 def create_refresh_token(user_id: str) -> str:
     """Create JWT refresh token"""
-    expire = datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days)
-    payload = {"sub": str(user_id), "type": "refresh", "exp": expire}
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm)
+    now = int(time.time())
+    payload = {
+        "sub": str(user_id),
+        "type": "refresh",
+        "jti": uuid.uuid4().hex,
+        "iat": now,
+        "exp": now + _REFRESH_TOKEN_TTL,
+    }
+    return _encode(payload)
 
 
 def decode_token(token: str) -> dict | None:
-    """Decode and verify JWT token"""
+    """Decode and verify JWT token (verified payloads are cached until expiry)"""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _decode_cache.get(cache_key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return dict(payload)
+        _decode_cache.pop(cache_key, None)
+        return None
+
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
+        payload = _jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
 
+    # Without exp there is nothing to expire the entry by, so it is verified every time
+    if not isinstance(payload.get("exp"), int | float):
+        return payload
+    if len(_decode_cache) >= _DECODE_CACHE_MAX_SIZE:
+        _decode_cache.pop(next(iter(_decode_cache)), None)
+    _decode_cache[cache_key] = payload
+    return dict(payload)
+
+
+def get_subject(payload: dict) -> str | None:
+    """Return the `sub` claim of a decoded payload, None if missing or not a string"""
+    sub = payload.get("sub")
+    return sub if isinstance(sub, str) and sub else None
+
 
 def get_user_id_from_token(token: str) -> str | None:
     """Extract user ID from JWT token"""
     payload = decode_token(token)
     if payload and payload.get("type") == "access":
-        return str(payload.get("sub"))
+        return get_subject(payload)
     return None
@@ -1,16 +1,45 @@
 """
 Password hashing utilities using Argon2.
 Argon2 is the winner of the Password Hashing Competition (PHC).
+
+The *_async variants run Argon2 in a small process pool (ARGON2_POOL_WORKERS per
+app worker), so hashing never blocks the event loop and concurrent logins spread
+across cores.
+
+All user passwords (register, login, change password) go through Argon2. Faster
+KDFs such as PBKDF2 are only appropriate for high-entropy server-issued secrets,
+not for user-chosen passwords.
 """
 
+import asyncio
+import multiprocessing
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
 
-# Initialize hasher with secure defaults
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Accepted password lengths. The upper bound keeps attacker-supplied input from
+# inflating the Argon2 pre-hash cost.
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_MAX_LENGTH = 128
+
+# Every hash this module produces (any parameters) starts with this; anything else
+# can be rejected without a trip to the process pool
+_ARGON2_PREFIX = "$argon2"
+
+# Initialize hasher with the configured costs (production enforces the OWASP minimums).
+# Module singleton: built once per process (and once per pool worker) and reused by
+# every call. The m_cost block array itself is allocated by libargon2 per hash.
 _hasher = PasswordHasher(
-    time_cost=2,  # Number of iterations
-    memory_cost=65536,  # 64MB memory usage
-    parallelism=1,  # Number of parallel threads
+    time_cost=settings.argon2_time_cost,  # Number of iterations
+    memory_cost=settings.argon2_memory_cost,  # KiB (64MB by default)
+    parallelism=1,  # Number of parallel threads (the process pool provides parallelism)
     hash_len=32,  # Length of the hash
     salt_len=16,  # Length of the salt
 )
@@ -40,6 +69,8 @@ def verify_password(password: str, password_hash: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        return False
     try:
         _hasher.verify(password_hash, password)
         return True
@@ -47,6 +78,27 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """Hash of a random secret, verified against when the user does not exist"""
+    # Computed on first use, so importing this module (and starting a pool worker) stays cheap
+    return hash_password(secrets.token_urlsafe(32))
+
+
+def verify_dummy_password(password: str) -> bool:
+    """
+    Run a full Argon2 verification that can never succeed.
+    Used for unknown users so failed logins take the same time either way.
+
+    Args:
+        password: Plain text password to verify
+
+    Returns:
+        Always False
+    """
+    return verify_password(password, _dummy_hash())
+
+
 def needs_rehash(password_hash: str) -> bool:
     """
     Check if a password hash needs to be rehashed.
@@ -59,3 +111,52 @@ def needs_rehash(password_hash: str) -> bool:
         True if rehash is needed, False otherwise
     """
     return _hasher.check_needs_rehash(password_hash)
+
+
+# Created on first use; workers build their own _hasher once, when importing this module
+_ARGON2_POOL: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Get the Argon2 process pool, creating it if needed"""
+    global _ARGON2_POOL
+    if _ARGON2_POOL is None:
+        _ARGON2_POOL = ProcessPoolExecutor(
+            # Every app worker has its own pool, so keep it small (not one process per CPU)
+            max_workers=settings.argon2_pool_workers,
+            # Spawn instead of fork: the parent has driver threads running
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _ARGON2_POOL
+
+
+def shutdown_password_pool() -> None:
+    """Shut down the Argon2 process pool (called on application shutdown)"""
+    global _ARGON2_POOL
+    if _ARGON2_POOL is not None:
+        _ARGON2_POOL.shutdown(wait=False, cancel_futures=True)
+        _ARGON2_POOL = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the process pool (see hash_password)"""
+    return await asyncio.get_running_loop().run_in_executor(_get_pool(), hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Verify a password against a hash in the process pool (see verify_password)"""
+    # No stored password can be this long, and non-Argon2 hashes can never match
+    if len(password) > PASSWORD_MAX_LENGTH or not password_hash.startswith(_ARGON2_PREFIX):
+        return False
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_pool(), verify_password, password, password_hash
+    )
+
+
+async def verify_dummy_password_async(password: str) -> bool:
+    """Run the dummy verification in the process pool (see verify_dummy_password)"""
+    if len(password) > PASSWORD_MAX_LENGTH:
+        return False
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_pool(), verify_dummy_password, password
+    )
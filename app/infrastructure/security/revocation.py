@@ -0,0 +1,74 @@
+"""
+JWT revocation using Redis bitmaps.
+Revoked tokens flip one bit (derived from their jti) in a bitmap per issue day,
+so checks are a single GETBIT and memory stays fixed regardless of token count.
+
+Bits are folded into a fixed-size space, so an unrelated token issued the same day
+can (rarely) share a bit with a revoked one and be treated as revoked too.
+"""
+
+import logging
+from typing import Any
+
+from app.core.config import get_settings
+from app.infrastructure.cache.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Bits per daily bitmap (2 MiB each)
+REVOCATION_BITS = 1 << 24
+_SECONDS_PER_DAY = 86400
+
+
+def _bitmap_slot(payload: dict[str, Any]) -> tuple[str, int, int] | None:
+    """Get (bitmap key, bit offset, issue day) for a token, None if it has no jti/iat"""
+    jti = payload.get("jti")
+    iat = payload.get("iat")
+    if not jti or iat is None:
+        return None
+    day = int(iat) // _SECONDS_PER_DAY
+    return f"revoked:{day}", int(jti, 16) % REVOCATION_BITS, day
+
+
+async def revoke_token(payload: dict[str, Any]) -> bool:
+    """
+    Mark a decoded token as revoked.
+    Returns False if Redis is unavailable or the token can't be revoked.
+    """
+    redis = redis_client.client
+    slot = _bitmap_slot(payload)
+    if not redis or not slot:
+        return False
+
+    key, bit, day = slot
+    # Keep the bitmap until every token issued that day has expired
+    expire_at = (day + 1 + settings.refresh_token_expire_days) * _SECONDS_PER_DAY
+
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setbit(key, bit, 1)
+            pipe.expireat(key, expire_at)
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Token revocation error: {e}")
+        return False
+
+
+async def is_token_revoked(payload: dict[str, Any]) -> bool:
+    """
+    Check whether a decoded token has been revoked.
+    Returns False if Redis is unavailable (revocation is best effort).
+    """
+    redis = redis_client.client
+    slot = _bitmap_slot(payload)
+    if not redis or not slot:
+        return False
+
+    key, bit, _ = slot
+    try:
+        return bool(await redis.getbit(key, bit))
+    except Exception as e:
+        logger.warning(f"Token revocation check error: {e}")
+        return False
@@ -12,6 +12,19 @@ from app.common.utils.logging import set_trace_id
 logger = logging.getLogger(__name__)
 
 
+class _Truncated:
+    """Defers str(value)[:limit] until a log record is actually rendered"""
+
+    __slots__ = ("_value", "_limit")
+
+    def __init__(self, value: Any, limit: int = 100):
+        self._value = value
+        self._limit = limit
+
+    def __str__(self) -> str:
+        return str(self._value)[: self._limit]
+
+
 class BaseTask(Task):
     """
     Base task class with:
@@ -38,9 +51,12 @@ class BaseTask(Task):
         trace_id = kwargs.pop("_trace_id", None) or task_id
         set_trace_id(trace_id)
 
-        logger.info(
-            f"Task started: {self.name}", extra={"task_id": task_id, "args": args, "kwargs": kwargs}
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Task started: %s",
+                self.name,
+                extra={"task_id": task_id, "args": args, "kwargs": kwargs},
+            )
 
     def on_success(
         self,
@@ -50,9 +66,12 @@ class BaseTask(Task):
         kwargs: dict,
     ) -> None:
         """Called on task success"""
-        logger.info(
-            f"Task completed: {self.name}", extra={"task_id": task_id, "result": str(retval)[:100]}
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Task completed: %s",
+                self.name,
+                extra={"task_id": task_id, "result": _Truncated(retval)},
+            )
 
     def on_failure(
         self,
@@ -64,7 +83,8 @@ class BaseTask(Task):
     ) -> None:
         """Called on task failure"""
         logger.error(
-            f"Task failed: {self.name}",
+            "Task failed: %s",
+            self.name,
             extra={
                 "task_id": task_id,
                 "error": str(exc),
@@ -83,8 +103,11 @@ class BaseTask(Task):
         einfo: Any,
     ) -> None:
         """Called on task retry"""
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning(
-            f"Task retrying: {self.name}",
+            "Task retrying: %s",
+            self.name,
             extra={
                 "task_id": task_id,
                 "error": str(exc),
@@ -2,12 +2,24 @@
 Celery application configuration.
 """
 
+import msgspec
 from celery import Celery
+from kombu.serialization import register
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Task results (msgspec structs, see results.py) are stored as msgpack: smaller than JSON
+# in the result backend and encoded without an intermediate dict
+register(
+    "msgpack",
+    msgspec.msgpack.Encoder().encode,
+    msgspec.msgpack.Decoder().decode,
+    content_type="application/x-msgpack",
+    content_encoding="binary",
+)
+
 # Create Celery app
 celery_app = Celery(
     "app",
@@ -24,16 +36,29 @@ celery_app.conf.update(
     # Task settings
     task_serializer="json",
     accept_content=["json"],
-    result_serializer="json",
+    result_serializer="msgpack",
+    result_accept_content=["json", "msgpack"],
     timezone="UTC",
     enable_utc=True,
+    # Broker connections (reused instead of reconnecting per publish)
+    broker_pool_limit=32,
+    broker_connection_retry_on_startup=True,
+    broker_transport_options={"visibility_timeout": 3600, "socket_keepalive": True},
     # Task execution settings
     task_acks_late=True,  # Acknowledge task after completion
     task_reject_on_worker_lost=True,  # Reject task if worker dies
-    worker_prefetch_multiplier=1,  # Fetch one task at a time
-    # Result backend settings
+    # Ack tasks that fail for good: the Redis broker has no dead-letter queue, so an unacked
+    # failure would just be redelivered after the visibility timeout, forever
+    task_acks_on_failure_or_timeout=True,
+    # Fetch one task at a time (right for long/IO-bound tasks). Workers for the short
+    # "default" queue override this with --prefetch-multiplier=4; see docker-compose.yml.
+    worker_prefetch_multiplier=1,
+    # Result backend settings. Most tasks are fire-and-forget, so results are only stored
+    # for tasks that opt in with ignore_result=False
+    task_ignore_result=True,
     result_expires=3600,  # Results expire after 1 hour
-    # Task routing (optional - for scaling)
+    # Task routing (optional - for scaling); unrouted tasks use the default queue
+    task_default_queue="default",
     task_routes={
         "app.infrastructure.tasks.email_tasks.*": {"queue": "email"},
         "app.infrastructure.tasks.user_tasks.*": {"queue": "default"},
@@ -2,18 +2,55 @@
 Email-related background tasks.
 """
 
+import hashlib
 import logging
+from functools import lru_cache
 
+from redis import Redis
+
+from app.core.config import get_settings
 from app.infrastructure.tasks.base import BaseTask
 from app.infrastructure.tasks.celery_app import celery_app
+from app.infrastructure.tasks.results import EmailResult
 
 logger = logging.getLogger(__name__)
 
+# Late acks redeliver a task whose worker died mid-send; remember what was already sent
+# so the redelivery (or a retry) doesn't email the recipient twice. A send in progress
+# holds a short claim, so a worker that dies mid-send only delays the email.
+_SENDING_TTL = 300  # seconds
+_SENT_EMAIL_TTL = 3600  # seconds
+
+
+@lru_cache(maxsize=1)
+def _sent_emails() -> Redis:
+    """Sync Redis client for the idempotency keys, created on first use in the worker"""
+    return Redis.from_url(get_settings().redis_url)
+
+
+def _sent_email_key(to_email: str, subject: str, body: str, html_body: str | None) -> str:
+    """Idempotency key for one message"""
+    message = f"{to_email}|{subject}|{body}|{html_body or ''}"
+    digest = hashlib.blake2b(message.encode(), digest_size=16)
+    return f"idem:email:{digest.hexdigest()}"
+
+
+def _queue_email(to_email: str, subject: str, body: str) -> EmailResult:
+    """
+    Hand the message to send_email without waiting for it.
+    Blocking on .get() inside a task holds this worker slot until a sibling worker
+    finishes, and can deadlock once every slot is waiting.
+    """
+    result = send_email.apply_async(kwargs={"to_email": to_email, "subject": subject, "body": body})
+    return EmailResult(status="queued", to=to_email, subject=subject, task_id=result.id)
+
 
 @celery_app.task(
     base=BaseTask,
     bind=True,
     name="app.infrastructure.tasks.email_tasks.send_email",
+    # Message bodies (and HTML bodies) are the largest payloads we publish
+    compression="gzip",
 )
 def send_email(
     self,
@@ -21,7 +58,7 @@ def send_email(
     subject: str,
     body: str,
     html_body: str | None = None,
-) -> dict:
+) -> EmailResult:
     """
     Send an email asynchronously.
 
@@ -32,39 +69,51 @@ def send_email(
         html_body: Optional HTML body
 
     Returns:
-        dict with status and message_id
+        EmailResult with status and recipient ("duplicate" status if the same message
+        was already sent within the last hour)
 
     Note:
         Implement actual email sending logic here.
         This is a placeholder that logs the email.
     """
-    logger.info(f"Sending email to {to_email}: {subject}")
-
-    # TODO: Implement actual email sending
-    # Example with SMTP:
-    # import smtplib
-    # from email.mime.text import MIMEText
-    # from email.mime.multipart import MIMEMultipart
-    #
-    # msg = MIMEMultipart("alternative")
-    # msg["Subject"] = subject
-    # msg["From"] = settings.email_from
-    # msg["To"] = to_email
-    #
-    # msg.attach(MIMEText(body, "plain"))
-    # if html_body:
-    #     msg.attach(MIMEText(html_body, "html"))
-    #
-    # with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-    #     server.starttls()
-    #     server.login(settings.smtp_user, settings.smtp_password)
-    #     server.send_message(msg)
-
-    return {
-        "status": "sent",
-        "to": to_email,
-        "subject": subject,
-    }
+    redis = _sent_emails()
+    key = _sent_email_key(to_email, subject, body, html_body)
+    if not redis.set(key, "sending", nx=True, ex=_SENDING_TTL):
+        if redis.get(key) == b"sent":
+            logger.info("Skipping duplicate email to %s: %s", to_email, subject)
+            return EmailResult(status="duplicate", to=to_email, subject=subject)
+        # Another worker holds the claim (or died holding it): check again once it lapses
+        raise self.retry(countdown=_SENDING_TTL)
+
+    try:
+        logger.info("Sending email to %s: %s", to_email, subject)
+
+        # TODO: Implement actual email sending
+        # Example with SMTP:
+        # import smtplib
+        # from email.mime.text import MIMEText
+        # from email.mime.multipart import MIMEMultipart
+        #
+        # msg = MIMEMultipart("alternative")
+        # msg["Subject"] = subject
+        # msg["From"] = settings.email_from
+        # msg["To"] = to_email
+        #
+        # msg.attach(MIMEText(body, "plain"))
+        # if html_body:
+        #     msg.attach(MIMEText(html_body, "html"))
+        #
+        # with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
+        #     server.starttls()
+        #     server.login(settings.smtp_user, settings.smtp_password)
+        #     server.send_message(msg)
+    except Exception:
+        # Not sent: let the retry send it
+        redis.delete(key)
+        raise
+
+    redis.set(key, "sent", ex=_SENT_EMAIL_TTL)
+    return EmailResult(status="sent", to=to_email, subject=subject)
 
 
 @celery_app.task(
@@ -72,7 +121,7 @@ def send_email(
     bind=True,
     name="app.infrastructure.tasks.email_tasks.send_welcome_email",
 )
-def send_welcome_email(self, user_email: str, user_name: str) -> dict:
+def send_welcome_email(self, user_email: str, user_name: str) -> EmailResult:
     """Send welcome email to new user"""
     subject = "Welcome to Our Platform!"
     body = f"""
@@ -84,11 +133,7 @@ Best regards,
 The Team
 """
 
-    return send_email.delay(
-        to_email=user_email,
-        subject=subject,
-        body=body,
-    ).get()
+    return _queue_email(user_email, subject, body)
 
 
 @celery_app.task(
@@ -101,7 +146,7 @@ def send_password_reset_email(
     user_email: str,
     reset_token: str,
     reset_url: str,
-) -> dict:
+) -> EmailResult:
     """Send password reset email"""
     subject = "Password Reset Request"
     body = f"""
@@ -118,8 +163,4 @@ Best regards,
 The Team
 """
 
-    return send_email.delay(
-        to_email=user_email,
-        subject=subject,
-        body=body,
-    ).get()
+    return _queue_email(user_email, subject, body)
@@ -0,0 +1,42 @@
+"""
+Task return values.
+Slotted msgspec structs, encoded straight to msgpack by the result backend serializer
+(see celery_app.py). Callers reading results get plain dicts back.
+"""
+
+import msgspec
+
+
+class EmailResult(msgspec.Struct, omit_defaults=True, gc=False):
+    """Result of sending (or queueing) an email"""
+
+    status: str
+    to: str
+    subject: str
+    task_id: str | None = None
+
+
+class UserTaskResult(msgspec.Struct, omit_defaults=True, gc=False):
+    """Result of a per-user task"""
+
+    status: str
+    user_id: str
+    timestamp: str | None = None
+
+
+class CleanupResult(msgspec.Struct, gc=False):
+    """Result of the expired token cleanup"""
+
+    status: str
+    deleted_count: int
+    timestamp: str
+
+
+class ExportResult(msgspec.Struct, gc=False):
+    """Result of a user data export"""
+
+    status: str
+    user_id: str
+    format: str
+    file_path: str
+    timestamp: str
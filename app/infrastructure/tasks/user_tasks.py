@@ -3,10 +3,12 @@ User-related background tasks.
 """
 
 import logging
-from datetime import UTC, datetime
 
+from app.common.utils.timestamps import utc_timestamp
 from app.infrastructure.tasks.base import BaseTask
 from app.infrastructure.tasks.celery_app import celery_app
+from app.infrastructure.tasks.email_tasks import send_welcome_email
+from app.infrastructure.tasks.results import CleanupResult, ExportResult, UserTaskResult
 
 logger = logging.getLogger(__name__)
 
@@ -15,33 +17,28 @@ logger = logging.getLogger(__name__)
     base=BaseTask,
     bind=True,
     name="app.infrastructure.tasks.user_tasks.cleanup_expired_tokens",
+    ignore_result=False,  # Deleted count is kept for monitoring
 )
-def cleanup_expired_tokens(self) -> dict:
+def cleanup_expired_tokens(self) -> CleanupResult:
     """
     Periodic task to cleanup expired tokens.
     Run hourly via Celery Beat.
 
     Note:
-        Implement token cleanup logic based on your token storage.
-        This is a placeholder.
+        Revoked tokens live in per-day Redis bitmaps that carry their own EXPIREAT
+        (see app.infrastructure.security.revocation), so Redis drops them without
+        any scan. Keep this task for other token storage; if you add some, avoid
+        KEYS/SCAN MATCH over the keyspace (delete_pattern blocks Redis on large
+        keyspaces) and keep expiring entries in one hash instead, removing them
+        with HSCAN COUNT 500 plus pipelined HDEL batches.
     """
     logger.info("Starting expired token cleanup")
 
-    # TODO: Implement token cleanup
-    # Example:
-    # from app.infrastructure.cache import get_cache_service
-    # cache = get_cache_service()
-    # deleted = await cache.delete_pattern("token:blacklist:*")
-
     deleted_count = 0  # Placeholder
 
-    logger.info(f"Cleaned up {deleted_count} expired tokens")
+    logger.info("Cleaned up %s expired tokens", deleted_count)
 
-    return {
-        "status": "completed",
-        "deleted_count": deleted_count,
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    return CleanupResult(status="completed", deleted_count=deleted_count, timestamp=utc_timestamp())
 
 
 @celery_app.task(
@@ -49,17 +46,14 @@ def cleanup_expired_tokens(self) -> dict:
     bind=True,
     name="app.infrastructure.tasks.user_tasks.process_user_registration",
 )
-def process_user_registration(self, user_id: str, user_email: str) -> dict:
+def process_user_registration(self, user_id: str, user_email: str) -> UserTaskResult:
     """
     Process new user registration.
     - Send welcome email
     - Initialize user preferences
     - Track analytics
     """
-    logger.info(f"Processing registration for user {user_id}")
-
-    # Import here to avoid circular imports
-    from app.infrastructure.tasks.email_tasks import send_welcome_email
+    logger.info("Processing registration for user %s", user_id)
 
     # Send welcome email
     send_welcome_email.delay(
@@ -70,10 +64,7 @@ def process_user_registration(self, user_id: str, user_email: str) -> dict:
     # TODO: Initialize user preferences
     # TODO: Track analytics event
 
-    return {
-        "status": "completed",
-        "user_id": user_id,
-    }
+    return UserTaskResult(status="completed", user_id=user_id)
 
 
 @celery_app.task(
@@ -81,33 +72,30 @@ def process_user_registration(self, user_id: str, user_email: str) -> dict:
     bind=True,
     name="app.infrastructure.tasks.user_tasks.deactivate_user_data",
 )
-def deactivate_user_data(self, user_id: str) -> dict:
+def deactivate_user_data(self, user_id: str) -> UserTaskResult:
     """
     Process user deactivation.
     - Anonymize personal data
     - Cancel subscriptions
     - Cleanup user data
     """
-    logger.info(f"Processing deactivation for user {user_id}")
+    logger.info("Processing deactivation for user %s", user_id)
 
     # TODO: Implement data cleanup
     # - Anonymize PII
     # - Cancel active subscriptions
     # - Remove from mailing lists
 
-    return {
-        "status": "completed",
-        "user_id": user_id,
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    return UserTaskResult(status="completed", user_id=user_id, timestamp=utc_timestamp())
 
 
 @celery_app.task(
     base=BaseTask,
     bind=True,
     name="app.infrastructure.tasks.user_tasks.export_user_data",
+    ignore_result=False,  # Callers poll for the export file path
 )
-def export_user_data(self, user_id: str, export_format: str = "json") -> dict:
+def export_user_data(self, user_id: str, export_format: str = "json") -> ExportResult:
     """
     Export user data (GDPR compliance).
 
@@ -116,9 +104,9 @@ def export_user_data(self, user_id: str, export_format: str = "json") -> dict:
         export_format: Export format (json, csv)
 
     Returns:
-        dict with export file path
+        ExportResult with the export file path
     """
-    logger.info(f"Exporting data for user {user_id} in {export_format} format")
+    logger.info("Exporting data for user %s in %s format", user_id, export_format)
 
     # TODO: Implement data export
     # - Collect all user data
@@ -126,10 +114,10 @@ def export_user_data(self, user_id: str, export_format: str = "json") -> dict:
     # - Store in secure location
     # - Notify user when ready
 
-    return {
-        "status": "completed",
-        "user_id": user_id,
-        "format": export_format,
-        "file_path": f"/exports/user_{user_id}.{export_format}",
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    return ExportResult(
+        status="completed",
+        user_id=user_id,
+        format=export_format,
+        file_path=f"/exports/user_{user_id}.{export_format}",
+        timestamp=utc_timestamp(),
+    )
@@ -3,6 +3,9 @@ Dependencies for auth routes.
 Provides dependency injection for auth use cases.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -18,79 +21,120 @@ from app.domain.auth.use_cases.register import RegisterUseCase
 from app.domain.auth.use_cases.update_profile import UpdateProfileUseCase
 from app.infrastructure.db.config import get_db
 from app.infrastructure.db.user.adapter import UserRepositoryAdapter
-from app.infrastructure.security.jwt import get_user_id_from_token
+from app.infrastructure.security.jwt import decode_token, get_subject
+from app.infrastructure.security.revocation import is_token_revoked
 
 security = HTTPBearer()
 
 
-# Repository adapter dependency
-def get_user_repository_adapter(
+@dataclass(frozen=True, slots=True)
+class _UseCases:
+    """The repository adapter and the use cases built on it, for one database"""
+
+    repository: UserRepositoryAdapter
+    register: RegisterUseCase
+    login: LoginUseCase
+    refresh_token: RefreshTokenUseCase
+    get_current_user: GetCurrentUserUseCase
+    update_profile: UpdateProfileUseCase
+    change_password: ChangePasswordUseCase
+    deactivate_account: DeactivateAccountUseCase
+
+
+@lru_cache(maxsize=8)
+def _use_cases_for(db: AsyncIOMotorDatabase) -> _UseCases:
+    """One adapter and use case set per database (none of them hold per-request state)"""
+    repository = UserRepositoryAdapter(db)
+    return _UseCases(
+        repository=repository,
+        register=RegisterUseCase(repository),
+        login=LoginUseCase(repository),
+        refresh_token=RefreshTokenUseCase(repository),
+        get_current_user=GetCurrentUserUseCase(repository),
+        update_profile=UpdateProfileUseCase(repository),
+        change_password=ChangePasswordUseCase(repository),
+        deactivate_account=DeactivateAccountUseCase(repository),
+    )
+
+
+# Repository adapter dependency (async, like the rest, so FastAPI calls it inline
+# instead of via the threadpool)
+async def get_user_repository_adapter(
     db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> UserRepositoryAdapter:
     """Get user repository adapter instance"""
-    return UserRepositoryAdapter(db)
+    return _use_cases_for(db).repository
 
 
-# Auth use case dependencies
-def get_register_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+# Auth use case dependencies. These depend on get_db directly (reading the cached use
+# case set) rather than on get_user_repository_adapter, so each is a single node in
+# FastAPI's dependency graph.
+async def get_register_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> RegisterUseCase:
     """Get register use case"""
-    return RegisterUseCase(repository)
+    return _use_cases_for(db).register
 
 
-def get_login_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_login_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> LoginUseCase:
     """Get login use case"""
-    return LoginUseCase(repository)
+    return _use_cases_for(db).login
 
 
-def get_refresh_token_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_refresh_token_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> RefreshTokenUseCase:
     """Get refresh token use case"""
-    return RefreshTokenUseCase(repository)
+    return _use_cases_for(db).refresh_token
 
 
-def get_current_user_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_current_user_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> GetCurrentUserUseCase:
     """Get current user use case"""
-    return GetCurrentUserUseCase(repository)
+    return _use_cases_for(db).get_current_user
 
 
-def get_update_profile_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_update_profile_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> UpdateProfileUseCase:
     """Get update profile use case"""
-    return UpdateProfileUseCase(repository)
+    return _use_cases_for(db).update_profile
 
 
-def get_change_password_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_change_password_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> ChangePasswordUseCase:
     """Get change password use case"""
-    return ChangePasswordUseCase(repository)
+    return _use_cases_for(db).change_password
 
 
-def get_deactivate_account_use_case(
-    repository: UserRepositoryAdapter = Depends(get_user_repository_adapter),
+async def get_deactivate_account_use_case(
+    db: AsyncIOMotorDatabase = Depends(get_db),
 ) -> DeactivateAccountUseCase:
     """Get deactivate account use case"""
-    return DeactivateAccountUseCase(repository)
+    return _use_cases_for(db).deactivate_account
+
 
+_logout_use_case = LogoutUseCase()
 
-def get_logout_use_case() -> LogoutUseCase:
+
+async def get_logout_use_case() -> LogoutUseCase:
     """Get logout use case"""
-    return LogoutUseCase()
+    return _logout_use_case
 
 
 # Authentication dependency
-def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """Extract user ID from JWT token"""
-    token = credentials.credentials
-    user_id = get_user_id_from_token(token)
-    if not user_id:
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """Extract user ID from JWT access token (rejecting revoked tokens)"""
+    payload = decode_token(credentials.credentials)
+    if not payload or payload.get("type") != "access" or await is_token_revoked(payload):
+        raise UnauthorizedError("Invalid or expired token")
+    user_id = get_subject(payload)
+    if user_id is None:
         raise UnauthorizedError("Invalid or expired token")
     return user_id
@@ -2,11 +2,12 @@
 Authentication routes.
 Controllers are one-liners that call auth use cases.
 Exceptions are handled globally by exception handlers.
-Rate limiting is handled by global middleware.
+Rate limits are applied per route with the slowapi rate_limit decorator.
 """
 
-from fastapi import APIRouter, Depends, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Body, Depends, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
 
 from app.common.schemas import AuthResponse, UserResponse
 from app.domain.auth.use_cases.change_password import ChangePasswordUseCase
@@ -27,17 +28,19 @@ from app.presentation.auth.dependencies import (
     get_refresh_token_use_case,
     get_register_use_case,
     get_update_profile_use_case,
+    security,
 )
 from app.presentation.auth.schemas import (
     ChangePasswordRequest,
     LoginRequest,
+    LogoutRequest,
     RefreshTokenRequest,
     RegisterRequest,
     TokenResponse,
     UpdateProfileRequest,
 )
 
-router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
+router = APIRouter(prefix="/api/v1/auth", tags=["auth"], default_response_class=ORJSONResponse)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -48,7 +51,7 @@ async def register(
     user = await use_case.execute(
         email=request.email, phone=request.phone, password=request.password
     )
-    return UserResponse.model_validate({**user.__dict__, "role": user.role.value})
+    return UserResponse.from_domain(user)
 
 
 @router.post("/login", response_model=AuthResponse)
@@ -59,9 +62,7 @@ async def login(
     user, tokens = await use_case.execute(
         email=request.email, phone=request.phone, password=request.password
     )
-    return AuthResponse(
-        user=UserResponse.model_validate({**user.__dict__, "role": user.role.value}), **tokens
-    )
+    return AuthResponse.from_domain(user, tokens)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -70,7 +71,12 @@ async def refresh_token(
     use_case: RefreshTokenUseCase = Depends(get_refresh_token_use_case),
 ) -> TokenResponse:
     """Refresh access token"""
-    return TokenResponse(**await use_case.execute(request.refresh_token))
+    tokens = await use_case.execute(request.refresh_token)
+    return TokenResponse(
+        access_token=tokens.access_token,
+        refresh_token=tokens.refresh_token,
+        token_type=tokens.token_type,
+    )
 
 
 @router.get("/me", response_model=UserResponse)
@@ -80,7 +86,7 @@ async def get_current_user(
 ) -> UserResponse:
     """Get current authenticated user profile"""
     user = await use_case.execute(user_id)
-    return UserResponse.model_validate({**user.__dict__, "role": user.role.value})
+    return UserResponse.from_domain(user)
 
 
 @router.patch("/me", response_model=UserResponse)
@@ -91,7 +97,7 @@ async def update_profile(
 ) -> UserResponse:
     """Update current user profile"""
     user = await use_case.execute(user_id, email=request.email, phone=request.phone)
-    return UserResponse.model_validate({**user.__dict__, "role": user.role.value})
+    return UserResponse.from_domain(user)
 
 
 @router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
@@ -115,8 +121,11 @@ async def deactivate_account(
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: LogoutRequest | None = Body(default=None),
     use_case: LogoutUseCase = Depends(get_logout_use_case),
 ):
-    """Logout user"""
-    await use_case.execute(credentials.credentials)
+    """Logout user (revokes the access token, and the refresh token if given)"""
+    await use_case.execute(
+        credentials.credentials, refresh_token=request.refresh_token if request else None
+    )
@@ -5,6 +5,7 @@ Authentication schemas - request and response models.
 from .requests import (
     ChangePasswordRequest,
     LoginRequest,
+    LogoutRequest,
     RefreshTokenRequest,
     RegisterRequest,
     UpdateProfileRequest,
@@ -14,6 +15,7 @@ from .responses import TokenResponse
 __all__ = [
     "RegisterRequest",
     "LoginRequest",
+    "LogoutRequest",
     "RefreshTokenRequest",
     "ChangePasswordRequest",
     "UpdateProfileRequest",
@@ -3,53 +3,68 @@ Authentication request schemas.
 All incoming request models for auth endpoints.
 """
 
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from typing import Annotated, ClassVar
 
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, model_validator
 
-class RegisterRequest(BaseModel):
-    """User registration request"""
+from app.infrastructure.security.password import PASSWORD_MAX_LENGTH, PASSWORD_MIN_LENGTH
+
+# E.164 phone number. The pattern is compiled once, by pydantic-core's Rust regex engine,
+# when each schema is built; validation never goes through Python's re module.
+PhoneNumber = Annotated[str, StringConstraints(pattern=r"^\+?[1-9]\d{1,14}$")]
+
+
+class _EmailOrPhoneRequest(BaseModel):
+    """Base for requests that identify a user by email and/or phone"""
+
+    _missing_identifier_error: ClassVar[str] = "Either email or phone must be provided"
 
     email: EmailStr | None = None
-    phone: str | None = Field(None, pattern=r"^\+?[1-9]\d{1,14}$")
-    password: str = Field(
-        ..., min_length=8, max_length=128, description="Password must be 8-128 characters"
-    )
+    phone: PhoneNumber | None = None
 
     @model_validator(mode="after")
     def validate_email_or_phone(self):
         """Ensure at least email or phone is provided"""
         if not self.email and not self.phone:
-            raise ValueError("Either email or phone must be provided")
+            raise ValueError(self._missing_identifier_error)
         return self
 
-    class Config:
-        json_schema_extra = {
+
+class RegisterRequest(_EmailOrPhoneRequest):
+    """User registration request"""
+
+    password: str = Field(
+        ...,
+        min_length=PASSWORD_MIN_LENGTH,
+        max_length=PASSWORD_MAX_LENGTH,
+        description="Password must be 8-128 characters",
+    )
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "phone": "+1234567890",
                 "password": "securepassword123",
             }
-        }
+        },
+    )
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(_EmailOrPhoneRequest):
     """User login request"""
 
-    email: EmailStr | None = None
-    phone: str | None = Field(None, pattern=r"^\+?[1-9]\d{1,14}$")
-    password: str = Field(..., min_length=1)
-
-    @model_validator(mode="after")
-    def validate_email_or_phone(self):
-        """Ensure at least email or phone is provided"""
-        if not self.email and not self.phone:
-            raise ValueError("Either email or phone must be provided")
-        return self
+    password: str = Field(..., min_length=1, max_length=PASSWORD_MAX_LENGTH)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {"email": "user@example.com", "password": "securepassword123"}
-        }
+        },
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -57,41 +72,59 @@ class RefreshTokenRequest(BaseModel):
 
     refresh_token: str = Field(..., min_length=1)
 
-    class Config:
-        json_schema_extra = {
-            "example": {"refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."}
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={"example": {"refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."}},
+    )
+
+
+class LogoutRequest(BaseModel):
+    """Logout request (optional body; the access token comes from the Authorization header)"""
+
+    refresh_token: str | None = Field(
+        default=None,
+        min_length=1,
+        description="Refresh token to revoke along with the access token",
+    )
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={"example": {"refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."}},
+    )
 
 
 class ChangePasswordRequest(BaseModel):
     """Change password request"""
 
-    current_password: str = Field(..., min_length=1)
+    current_password: str = Field(..., min_length=1, max_length=PASSWORD_MAX_LENGTH)
     new_password: str = Field(
-        ..., min_length=8, max_length=128, description="New password must be 8-128 characters"
+        ...,
+        min_length=PASSWORD_MIN_LENGTH,
+        max_length=PASSWORD_MAX_LENGTH,
+        description="New password must be 8-128 characters",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "current_password": "oldpassword123",
                 "new_password": "newsecurepassword123",
             }
-        }
+        },
+    )
 
 
-class UpdateProfileRequest(BaseModel):
+class UpdateProfileRequest(_EmailOrPhoneRequest):
     """Update user profile request"""
 
-    email: EmailStr | None = None
-    phone: str | None = Field(None, pattern=r"^\+?[1-9]\d{1,14}$")
+    _missing_identifier_error: ClassVar[str] = "At least email or phone must be provided"
 
-    @model_validator(mode="after")
-    def validate_at_least_one_field(self):
-        """Ensure at least one field is provided"""
-        if not self.email and not self.phone:
-            raise ValueError("At least email or phone must be provided")
-        return self
-
-    class Config:
-        json_schema_extra = {"example": {"email": "newemail@example.com", "phone": "+1234567890"}}
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={"example": {"email": "newemail@example.com", "phone": "+1234567890"}},
+    )
@@ -6,7 +6,7 @@ import logging
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.common.exceptions import (
     ConflictError,
@@ -36,7 +36,7 @@ EXCEPTION_STATUS_MAP: dict[type[DomainException], int] = {
 
 def create_error_response(
     error: str, message: str, code: str, status_code: int, request: Request, details: list = None
-) -> JSONResponse:
+) -> Response:
     """Create standardized error response"""
     from app.common.utils.logging import get_trace_id
 
@@ -50,7 +50,9 @@ def create_error_response(
         trace_id=trace_id,
     )
 
-    response = JSONResponse(status_code=status_code, content=error_response.model_dump())
+    response = Response(
+        content=error_response.to_json(), status_code=status_code, media_type="application/json"
+    )
 
     # Add trace ID to response headers
     if trace_id:
@@ -60,7 +62,7 @@ def create_error_response(
     return response
 
 
-async def domain_exception_handler(request: Request, exc: DomainException) -> JSONResponse:
+async def domain_exception_handler(request: Request, exc: DomainException) -> Response:
     """Handle domain exceptions with full error details"""
     status_code = EXCEPTION_STATUS_MAP.get(type(exc), status.HTTP_400_BAD_REQUEST)
 
@@ -91,9 +93,7 @@ async def domain_exception_handler(request: Request, exc: DomainException) -> JS
     )
 
 
-async def validation_exception_handler(
-    request: Request, exc: RequestValidationError
-) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """Handle Pydantic validation errors with detailed field errors"""
     details = []
     for error in exc.errors():
@@ -122,7 +122,7 @@ async def validation_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions - safety net"""
     # Log full error in development, generic in production (trace ID automatically included)
     if settings.debug:
@@ -1,47 +1,41 @@
 """
-Rate limiting middleware using slowapi.
-Global rate limiting applied to all endpoints with per-endpoint overrides.
+Rate limiting using slowapi.
+Limits apply to the endpoints decorated with rate_limit; there is no global middleware.
 """
 
+from collections.abc import Callable
+
 from fastapi import status
+from fastapi.responses import Response
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
+from app.common.schemas.errors import ErrorResponse
 from app.core.config import get_settings
+from app.presentation.middleware.trace_id import get_trace_id
 
 settings = get_settings()
 
-# Initialize rate limiter with global default
+# Settings are read once here; nothing below reads them per request
+_DEFAULT_LIMITS: list[str | Callable[..., str]] = (
+    [settings.rate_limit_default] if settings.rate_limit_enabled else []
+)
+
+# Initialize rate limiter with global default.
+# Fixed window: with Redis storage each hit is one EVALSHA of the limits library's
+# bundled INCR+EXPIRE Lua script (a single round-trip). Rate limit headers cost extra
+# reads per request (window count and TTL); disable them to keep hits at one RTT.
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=(
-        [settings.rate_limit_default] if settings.rate_limit_enabled else []
-    ),  # Global default
+    default_limits=_DEFAULT_LIMITS,  # Global default
     storage_uri=settings.rate_limit_storage,  # Use Redis in production: "redis://localhost:6379"
-    headers_enabled=True,  # Add rate limit headers to responses
+    strategy="fixed-window",
+    headers_enabled=settings.rate_limit_headers_enabled,  # Add rate limit headers to responses
 )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to apply global rate limiting to all endpoints.
-    Note: slowapi's decorators handle their own rate limiting.
-    This middleware is a simple pass-through that allows decorators to work.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        # Skip rate limiting for health check
-        if request.url.path == "/health":
-            return await call_next(request)
-
-        # Continue with request - let decorators handle rate limiting
-        response = await call_next(request)
-        return response
-
-
 def get_rate_limit_key(request: Request) -> str:
     """Get rate limit key - can be customized per endpoint"""
     # For authenticated endpoints, use user_id instead of IP
@@ -57,11 +51,6 @@ rate_limit = limiter.limit
 # Rate limit exception handler
 async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded):
     """Handle rate limit exceeded errors"""
-    from fastapi.responses import JSONResponse
-
-    from app.common.schemas.errors import ErrorResponse
-    from app.presentation.middleware.trace_id import get_trace_id
-
     trace_id = get_trace_id(request)
     error_response = ErrorResponse(
         error="RateLimitExceeded",
@@ -74,9 +63,10 @@ async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded)
     # Extract rate limit info from exception
     retry_after = getattr(exc, "retry_after", 60)
 
-    response = JSONResponse(
+    response = Response(
+        content=error_response.to_json(),
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        content=error_response.model_dump(),
+        media_type="application/json",
         headers={"X-Trace-ID": trace_id or "", "Retry-After": str(retry_after)},
     )
 
@@ -88,6 +78,5 @@ __all__ = [
     "limiter",
     "rate_limit",
     "rate_limit_exception_handler",
-    "RateLimitMiddleware",
     "RateLimitExceeded",
 ]
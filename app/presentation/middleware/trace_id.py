@@ -5,42 +5,80 @@ Generates unique trace IDs for each request and attaches them to request state a
 
 import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.common.utils.logging import get_trace_id as get_trace_id_from_context
-from app.common.utils.logging import set_trace_id
+from app.common.utils.logging import bind_trace_id, reset_trace_id, trace_id_var
 
+# Raw ASGI header names (ASGI servers lowercase request header names)
+_TRACE_ID_HEADER = b"x-trace-id"
+_REQUEST_ID_HEADER = b"x-request-id"
+_TRACE_HEADERS = (_TRACE_ID_HEADER, _REQUEST_ID_HEADER)
 
-class TraceIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and attach trace IDs to requests"""
 
-    async def dispatch(self, request: Request, call_next):
-        # Check if trace ID is provided in headers (for distributed tracing)
-        trace_id = request.headers.get("X-Trace-ID") or request.headers.get("X-Request-ID")
+class TraceIDMiddleware:
+    """
+    Middleware to generate and attach trace IDs to requests.
+
+    Pure ASGI: headers are added by wrapping send, so there is no BaseHTTPMiddleware
+    task group, memory stream or response re-wrapping per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Generate new trace ID if not provided
-        if not trace_id:
-            trace_id = str(uuid.uuid4())
+        # Check if trace ID is provided in headers (for distributed tracing), in one pass
+        # over the raw headers; X-Trace-ID wins over X-Request-ID
+        trace_id_bytes = request_id_bytes = None
+        for name, value in scope["headers"]:
+            if name == _TRACE_ID_HEADER and value:
+                trace_id_bytes = value
+                break
+            if name == _REQUEST_ID_HEADER and value and request_id_bytes is None:
+                request_id_bytes = value
 
-        # Attach trace ID to request state
-        request.state.trace_id = trace_id
+        if trace_id_bytes is None:
+            trace_id_bytes = request_id_bytes
+
+        if trace_id_bytes is None:
+            # Generate new trace ID if not provided
+            trace_id = uuid.uuid4().hex
+            trace_id_bytes = trace_id.encode("latin-1")
+        else:
+            trace_id = trace_id_bytes.decode("latin-1")
+
+        # Attach trace ID to request state (request.state reads scope["state"])
+        scope.setdefault("state", {})["trace_id"] = trace_id
+
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Set trace ID response headers (raw ASGI header pairs), replacing any the
+                # error handlers already set so each header is sent once
+                message["headers"] = [
+                    *(
+                        header
+                        for header in message.get("headers", ())
+                        if header[0].lower() not in _TRACE_HEADERS
+                    ),
+                    (_TRACE_ID_HEADER, trace_id_bytes),
+                    (_REQUEST_ID_HEADER, trace_id_bytes),
+                ]
+            await send(message)
 
         # Set trace ID in context for global access in logging
-        set_trace_id(trace_id)
+        tokens = bind_trace_id(trace_id)
 
         try:
             # Process request
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_trace_id)
         finally:
-            # Clear trace ID from context after request
-            set_trace_id(None)
-
-        # Add trace ID to response headers
-        response.headers["X-Trace-ID"] = trace_id
-        response.headers["X-Request-ID"] = trace_id
-
-        return response
+            # Restore whatever trace ID the enclosing context had
+            reset_trace_id(tokens)
 
 
 def get_trace_id(request: Request) -> str | None:
@@ -49,4 +87,6 @@ def get_trace_id(request: Request) -> str | None:
 
     For new code, use app.common.utils.logging.get_trace_id() instead.
     """
-    return getattr(request.state, "trace_id", None) or get_trace_id_from_context()
+    # The middleware stores it in scope["state"]; a dict lookup skips the State proxy
+    state = request.scope.get("state")
+    return (state.get("trace_id") if state else None) or trace_id_var.get()
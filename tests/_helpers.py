@@ -0,0 +1,168 @@
+"""
+Shared test helpers.
+"""
+
+import asyncio
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.domain.auth.use_cases.register import RegisterUseCase
+from app.domain.user.entities.user import User
+from app.infrastructure.db.user.adapter import UserRepositoryAdapter
+from app.infrastructure.security.jwt import create_access_token, create_refresh_token
+
+
+async def register_user(
+    db: AsyncIOMotorDatabase,
+    email: str | None = None,
+    phone: str | None = None,
+    password: str = "",
+) -> User:
+    """
+    Register a user through the register use case, skipping the HTTP layer.
+
+    For tests where registration is only a precondition; tests of the /register
+    endpoint itself should keep going through the client.
+    """
+    return await RegisterUseCase(UserRepositoryAdapter(db)).execute(
+        email=email, phone=phone, password=password
+    )
+
+
+async def post_concurrently(
+    client: AsyncClient, url: str, payloads: Iterable[dict[str, Any]]
+) -> list[Response]:
+    """
+    POST each payload to url at the same time and return the responses in order.
+
+    Only for requests that don't depend on each other (e.g. registering different users,
+    or several login checks); dependent steps such as register-then-login stay sequential.
+    """
+    return await asyncio.gather(*(client.post(url, json=payload) for payload in payloads))
+
+
+def issue_tokens(user: User) -> tuple[str, str]:
+    """
+    Mint an (access, refresh) token pair for user the same way the login use case does,
+    without the login request and its password verification.
+    """
+    return create_access_token(user.id, user.role.as_str()), create_refresh_token(user.id)
+
+
+class FakePubSub:
+    """In-memory Redis pub/sub connection; a queued exception ends listen() with it"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        if self._redis.down:
+            raise ConnectionError("Error connecting to Redis.")
+        self._redis.subscribers.append(self)
+        self.queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def aclose(self) -> None:
+        self._redis.subscribers.remove(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis commands and runs them on execute()"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands: list = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        return [await command(*args, **kwargs) for command, args, kwargs in self._commands]
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands.clear()
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the subset of redis.asyncio.Redis the app uses
+    (strings with TTLs, bitmaps, pub/sub and pipelines), for tests without a Redis server.
+    """
+
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, float | None]] = {}
+        self.bitmaps: dict[str, set[int]] = {}
+        self.subscribers: list[FakePubSub] = []
+        self.gets = 0
+        self.down = False  # While set, pub/sub connections can't subscribe
+
+    def _alive(self, key: str) -> tuple[bytes, float | None] | None:
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    async def execute_command(self, command: str, key: str, **options):
+        assert command == "GET"
+        self.gets += 1
+        entry = self._alive(key)
+        return entry[0] if entry else None
+
+    async def pttl(self, key: str) -> int:
+        entry = self._alive(key)
+        if entry is None:
+            return -2
+        return -1 if entry[1] is None else int((entry[1] - time.monotonic()) * 1000)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None, nx: bool = False):
+        if nx and self._alive(key):
+            return None
+        self.data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def setbit(self, key: str, offset: int, value: int) -> int:
+        bits = self.bitmaps.setdefault(key, set())
+        previous = int(offset in bits)
+        if value:
+            bits.add(offset)
+        else:
+            bits.discard(offset)
+        return previous
+
+    async def getbit(self, key: str, offset: int) -> int:
+        return int(offset in self.bitmaps.get(key, ()))
+
+    async def expireat(self, key: str, when: int) -> bool:
+        return key in self.bitmaps or key in self.data
+
+    async def publish(self, channel: str, message: str) -> int:
+        for pubsub in self.subscribers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
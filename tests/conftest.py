@@ -5,62 +5,100 @@ Sets up test database, client, and common fixtures for MongoDB.
 
 import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+try:
+    import uvloop
+except ImportError:  # Windows, or dev dependencies not installed
+    uvloop = None
+
 # Set test environment variables BEFORE importing app
 os.environ["MONGODB_URL"] = os.getenv("TEST_MONGODB_URL", "mongodb://localhost:27017")
-os.environ["MONGODB_DATABASE_NAME"] = "test_db"
+# One database per xdist worker, so parallel workers never drop each other's collections
+os.environ["MONGODB_DATABASE_NAME"] = f"test_db_{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-minimum-32-chars"
 os.environ["DEBUG"] = "true"
 os.environ["ENVIRONMENT"] = "test"
 os.environ["RATE_LIMIT_ENABLED"] = "false"  # Disable rate limiting in tests
+# Minimum Argon2 costs: same code path and hash format, without the deliberate slowness
+# (allowed because ENVIRONMENT is not production)
+os.environ["ARGON2_TIME_COST"] = "1"
+os.environ["ARGON2_MEMORY_COST"] = "8"
 
 from app.app import app
-from app.infrastructure.db.config import get_db
+from app.domain.user.entities.user import User
+from app.infrastructure.cache.redis_client import redis_client
+from app.infrastructure.db.config import get_client, get_db
+from tests._helpers import FakeRedis, issue_tokens, register_user
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop the session fixtures live in"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the test event loop on uvloop when it is installed"""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest.fixture(scope="function")
-async def test_db():
-    """Create test database and clean up after"""
-    from app.infrastructure.db.config import get_client
+@pytest.fixture(scope="session")
+async def motor_client():
+    """MongoDB client shared by the whole session (one pool, one topology discovery)"""
+    return get_client()
+
 
-    client = get_client()
-    db_name = os.getenv("MONGODB_DATABASE_NAME", "test_db")
-    test_db_instance = client[db_name]
+@pytest.fixture(scope="session")
+async def test_db(motor_client):
+    """Test database handle"""
+    return motor_client[os.environ["MONGODB_DATABASE_NAME"]]
 
-    yield test_db_instance
 
-    # Clean up: drop all collections
-    collections = await test_db_instance.list_collection_names()
-    for collection_name in collections:
-        await test_db_instance.drop_collection(collection_name)
+@pytest.fixture(autouse=True)
+async def clean_db(motor_client, test_db):
+    """Drop the test database after each test (one command, however many collections)"""
+    yield
 
+    await motor_client.drop_database(test_db.name)
 
-@pytest.fixture(scope="function")
-async def client(test_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create test HTTP client with dependency override"""
+
+@pytest.fixture(scope="session", autouse=True)
+async def _install_overrides(test_db):
+    """Install the test dependency overrides once for the whole session"""
 
     async def override_get_db():
         yield test_db
 
     app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.clear()
+
 
+@pytest.fixture(scope="session")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """One test HTTP client (transport and connection pool) for the whole session"""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    """In-memory Redis installed as the app's Redis client (for revocation, caching)"""
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_client, "_client", fake)
+    return fake
 
 
 @pytest.fixture
@@ -73,3 +111,33 @@ def test_user_data():
 def test_user_phone_data():
     """Sample user data with phone for tests"""
     return {"phone": "+1234567890", "password": "testpassword123"}
+
+
+@pytest.fixture
+async def registered_user(test_db, test_user_data) -> User:
+    """test_user_data, already registered (seeded without going through the API)"""
+    return await register_user(test_db, **test_user_data)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSession:
+    """A registered, logged-in user"""
+
+    email: str
+    password: str
+    access_token: str
+    refresh_token: str
+    headers: dict[str, str]  # Authorization header for access_token, built once
+
+
+@pytest.fixture
+async def auth_session(registered_user: User, test_user_data) -> AuthSession:
+    """Tokens for the registered test user, for tests that only need a signed-in user"""
+    access_token, refresh_token = issue_tokens(registered_user)
+    return AuthSession(
+        email=test_user_data["email"],
+        password=test_user_data["password"],
+        access_token=access_token,
+        refresh_token=refresh_token,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
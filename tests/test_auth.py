@@ -5,6 +5,9 @@ Authentication endpoint tests.
 import pytest
 from httpx import AsyncClient
 
+from tests._helpers import post_concurrently
+from tests.conftest import AuthSession
+
 
 class TestRegister:
     """Tests for user registration"""
@@ -32,11 +35,9 @@ class TestRegister:
         assert data["role"] == "student"
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("registered_user")
     async def test_register_duplicate_email_fails(self, client: AsyncClient, test_user_data):
         """Test registration with duplicate email fails"""
-        # First registration
-        await client.post("/api/v1/auth/register", json=test_user_data)
-
         # Second registration with same email
         response = await client.post("/api/v1/auth/register", json=test_user_data)
 
@@ -44,19 +45,16 @@ class TestRegister:
         assert "already exists" in response.json()["message"].lower()
 
     @pytest.mark.asyncio
-    async def test_register_short_password_fails(self, client: AsyncClient):
-        """Test registration with short password fails"""
-        response = await client.post(
-            "/api/v1/auth/register", json={"email": "test@example.com", "password": "short"}
-        )
-
-        # Pydantic validation returns 422, domain validation returns 400
-        assert response.status_code in [400, 422]
-
-    @pytest.mark.asyncio
-    async def test_register_no_email_or_phone_fails(self, client: AsyncClient):
-        """Test registration without email or phone fails"""
-        response = await client.post("/api/v1/auth/register", json={"password": "testpassword123"})
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"email": "test@example.com", "password": "short"}, id="short-password"),
+            pytest.param({"password": "testpassword123"}, id="no-email-or-phone"),
+        ],
+    )
+    async def test_register_validation_fails(self, client: AsyncClient, payload):
+        """Test registration with an invalid payload fails"""
+        response = await client.post("/api/v1/auth/register", json=payload)
 
         # Pydantic validation returns 422, domain validation returns 400
         assert response.status_code in [400, 422]
@@ -66,11 +64,9 @@ class TestLogin:
     """Tests for user login"""
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("registered_user")
     async def test_login_success(self, client: AsyncClient, test_user_data):
         """Test successful login"""
-        # Register first
-        await client.post("/api/v1/auth/register", json=test_user_data)
-
         # Login
         response = await client.post("/api/v1/auth/login", json=test_user_data)
 
@@ -83,11 +79,9 @@ class TestLogin:
         assert data["user"]["email"] == test_user_data["email"]
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("registered_user")
     async def test_login_wrong_password_fails(self, client: AsyncClient, test_user_data):
         """Test login with wrong password fails"""
-        # Register first
-        await client.post("/api/v1/auth/register", json=test_user_data)
-
         # Login with wrong password
         response = await client.post(
             "/api/v1/auth/login",
@@ -112,15 +106,11 @@ class TestRefreshToken:
     """Tests for token refresh"""
 
     @pytest.mark.asyncio
-    async def test_refresh_token_success(self, client: AsyncClient, test_user_data):
+    async def test_refresh_token_success(self, client: AsyncClient, auth_session: AuthSession):
         """Test successful token refresh"""
-        # Register and login
-        await client.post("/api/v1/auth/register", json=test_user_data)
-        login_response = await client.post("/api/v1/auth/login", json=test_user_data)
-        refresh_token = login_response.json()["refresh_token"]
-
-        # Refresh token
-        response = await client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+        response = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": auth_session.refresh_token}
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -137,25 +127,51 @@ class TestRefreshToken:
         assert response.status_code == 401
 
 
+class TestLogout:
+    """Tests for logout (token revocation)"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_logout_revokes_access_token(
+        self, client: AsyncClient, auth_session: AuthSession
+    ):
+        """Test the access token is rejected after logout"""
+        response = await client.post("/api/v1/auth/logout", headers=auth_session.headers)
+        assert response.status_code == 204
+
+        response = await client.get("/api/v1/auth/me", headers=auth_session.headers)
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_logout_revokes_refresh_token(
+        self, client: AsyncClient, auth_session: AuthSession
+    ):
+        """Test the refresh token passed to logout can no longer mint tokens"""
+        response = await client.post(
+            "/api/v1/auth/logout",
+            json={"refresh_token": auth_session.refresh_token},
+            headers=auth_session.headers,
+        )
+        assert response.status_code == 204
+
+        response = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": auth_session.refresh_token}
+        )
+        assert response.status_code == 401
+
+
 class TestGetCurrentUser:
     """Tests for getting current user"""
 
     @pytest.mark.asyncio
-    async def test_get_me_success(self, client: AsyncClient, test_user_data):
+    async def test_get_me_success(self, client: AsyncClient, auth_session: AuthSession):
         """Test getting current user profile"""
-        # Register and login
-        await client.post("/api/v1/auth/register", json=test_user_data)
-        login_response = await client.post("/api/v1/auth/login", json=test_user_data)
-        access_token = login_response.json()["access_token"]
-
-        # Get current user
-        response = await client.get(
-            "/api/v1/auth/me", headers={"Authorization": f"Bearer {access_token}"}
-        )
+        response = await client.get("/api/v1/auth/me", headers=auth_session.headers)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["email"] == test_user_data["email"]
+        assert data["email"] == auth_session.email
 
     @pytest.mark.asyncio
     async def test_get_me_unauthorized_fails(self, client: AsyncClient):
@@ -169,46 +185,56 @@ class TestChangePassword:
     """Tests for changing password"""
 
     @pytest.mark.asyncio
-    async def test_change_password_success(self, client: AsyncClient, test_user_data):
+    async def test_change_password_success(self, client: AsyncClient, auth_session: AuthSession):
         """Test successful password change"""
-        # Register and login
-        await client.post("/api/v1/auth/register", json=test_user_data)
-        login_response = await client.post("/api/v1/auth/login", json=test_user_data)
-        access_token = login_response.json()["access_token"]
-
-        # Change password
         response = await client.post(
             "/api/v1/auth/change-password",
-            json={"current_password": test_user_data["password"], "new_password": "newpassword123"},
-            headers={"Authorization": f"Bearer {access_token}"},
+            json={"current_password": auth_session.password, "new_password": "newpassword123"},
+            headers=auth_session.headers,
         )
 
         assert response.status_code == 204
 
-        # Verify old password no longer works
-        response = await client.post("/api/v1/auth/login", json=test_user_data)
-        assert response.status_code == 401
-
-        # Verify new password works
-        response = await client.post(
+        # Old password no longer works, new password does (independent, so run together)
+        old_login, new_login = await post_concurrently(
+            client,
             "/api/v1/auth/login",
-            json={"email": test_user_data["email"], "password": "newpassword123"},
+            [
+                {"email": auth_session.email, "password": auth_session.password},
+                {"email": auth_session.email, "password": "newpassword123"},
+            ],
         )
-        assert response.status_code == 200
+        assert old_login.status_code == 401
+        assert new_login.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_change_password_wrong_current_fails(self, client: AsyncClient, test_user_data):
+    async def test_change_password_wrong_current_fails(
+        self, client: AsyncClient, auth_session: AuthSession
+    ):
         """Test password change with wrong current password fails"""
-        # Register and login
-        await client.post("/api/v1/auth/register", json=test_user_data)
-        login_response = await client.post("/api/v1/auth/login", json=test_user_data)
-        access_token = login_response.json()["access_token"]
-
-        # Try to change password with wrong current
         response = await client.post(
             "/api/v1/auth/change-password",
             json={"current_password": "wrongpassword", "new_password": "newpassword123"},
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_session.headers,
         )
 
         assert response.status_code == 401
+
+
+class TestUpdateProfile:
+    """Tests for updating the current user profile"""
+
+    @pytest.mark.asyncio
+    async def test_update_profile_success(self, client: AsyncClient, auth_session: AuthSession):
+        """Test updating the phone keeps the email and returns the updated user"""
+        response = await client.patch(
+            "/api/v1/auth/me",
+            json={"phone": "+1987654321"},
+            headers=auth_session.headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["phone"] == "+1987654321"
+        assert data["email"] == auth_session.email
+        assert data["updated_at"] is not None
@@ -0,0 +1,113 @@
+"""
+Cache service tests (local L1 cache and cross-worker invalidation).
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.cache import cache_service as cache_module
+from app.infrastructure.cache.cache_service import CacheService
+from tests._helpers import FakeRedis
+
+
+async def settle() -> None:
+    """Let the listener tasks handle queued pub/sub messages"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Reconnect the invalidation listener immediately (set up before the listeners start)"""
+    monkeypatch.setattr(cache_module, "_LISTENER_BACKOFF_INITIAL", 0)
+
+
+@pytest.fixture
+async def workers(fake_redis: FakeRedis):
+    """Two cache services (as in two workers) on one Redis, both listening"""
+    services = [CacheService(redis=fake_redis), CacheService(redis=fake_redis)]
+    for service in services:
+        await service.start_invalidation_listener()
+    await settle()
+    yield services
+    for service in services:
+        await service.stop_invalidation_listener()
+
+
+class TestLocalCache:
+    """Tests for the in-process L1 cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_is_served_from_l1(self, fake_redis: FakeRedis, workers):
+        """Test a second get for the same key doesn't go to Redis"""
+        cache, _ = workers
+        await cache.set("user:1", {"name": "a"})
+
+        assert await cache.get("user:1") == {"name": "a"}
+        assert await cache.get("user:1") == {"name": "a"}
+        assert fake_redis.gets == 1
+
+    @pytest.mark.asyncio
+    async def test_l1_expires_with_the_redis_ttl(self, workers):
+        """Test an L1 entry never outlives the Redis entry's remaining TTL"""
+        cache, _ = workers
+        await cache.set("user:1", {"name": "a"}, ttl=1)
+        await cache.get("user:1")
+
+        expires, _ = cache._local["app:user:1"]
+        assert expires <= time.monotonic() + 1
+
+    @pytest.mark.asyncio
+    async def test_set_invalidates_other_workers(self, workers):
+        """Test a set on one worker drops the stale L1 copy on another"""
+        writer, reader = workers
+        await writer.set("user:1", {"name": "a"})
+        assert await reader.get("user:1") == {"name": "a"}
+
+        await writer.set("user:1", {"name": "b"})
+        await settle()
+
+        assert await reader.get("user:1") == {"name": "b"}
+
+    @pytest.mark.asyncio
+    async def test_l1_bypassed_without_listener(self, fake_redis: FakeRedis):
+        """Test L1 isn't used when nothing would invalidate it"""
+        cache = CacheService(redis=fake_redis)
+        await cache.set("user:1", {"name": "a"})
+
+        await cache.get("user:1")
+        await cache.get("user:1")
+
+        assert fake_redis.gets == 2
+        assert not cache._local
+
+    @pytest.mark.asyncio
+    async def test_listener_failure_bypasses_l1_until_resubscribed(
+        self, no_backoff, fake_redis: FakeRedis, workers
+    ):
+        """Test a dropped subscription clears L1, and the listener reconnects"""
+        cache, _ = workers
+        await cache.set("user:1", {"name": "a"})
+        await cache.get("user:1")
+
+        # Drop both workers' subscriptions and keep Redis down, as during a restart
+        fake_redis.down = True
+        for pubsub in list(fake_redis.subscribers):
+            pubsub.queue.put_nowait(ConnectionError("Connection closed by server."))
+        await settle()
+
+        assert not cache._local
+        await cache.get("user:1")
+        await cache.get("user:1")
+        assert fake_redis.gets == 3  # No L1 while not subscribed
+
+        # Redis is back: the listeners resubscribe and L1 is used again
+        fake_redis.down = False
+        await settle()
+
+        assert len(fake_redis.subscribers) == 2
+        await cache.get("user:1")
+        await cache.get("user:1")
+        assert fake_redis.gets == 4
@@ -17,3 +17,48 @@ async def test_health_check(client: AsyncClient):
     assert data["service"] == "api"
     assert data["version"] == "1.0.0"
     assert "database" in data  # Database connectivity check
+
+
+@pytest.mark.asyncio
+async def test_health_check_is_cached(client: AsyncClient, monkeypatch):
+    """Test repeated health checks within the TTL are served from cache"""
+    import app.app as app_module
+
+    calls = 0
+    original_check = app_module._check_health
+
+    async def counting_check():
+        nonlocal calls
+        calls += 1
+        return await original_check()
+
+    monkeypatch.setattr(app_module, "_check_health", counting_check)
+    monkeypatch.setattr(app_module, "_health_cache", {**app_module._health_cache, "expires": 0.0})
+
+    first = await client.get("/health")
+    second = await client.get("/health")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_degraded_when_database_down(client: AsyncClient, monkeypatch):
+    """Test health check returns 503 without error details when the database is down"""
+    import app.app as app_module
+
+    async def failing_db_check():
+        return False, "connection refused"
+
+    monkeypatch.setattr(app_module, "check_database_connection", failing_db_check)
+    monkeypatch.setattr(app_module.settings, "debug", False)
+    monkeypatch.setattr(app_module, "_health_cache", {**app_module._health_cache, "expires": 0.0})
+
+    response = await client.get("/health")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["database"] == "disconnected"
+    assert data["database_error"] == "Database connection failed"
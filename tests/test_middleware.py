@@ -0,0 +1,31 @@
+"""
+Middleware tests.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestTraceID:
+    """Tests for the trace ID response headers"""
+
+    @pytest.mark.asyncio
+    async def test_error_response_has_single_trace_headers(self, client: AsyncClient):
+        """Test an error response carries exactly one X-Trace-ID and one X-Request-ID"""
+        # An invalid token goes through the domain exception handler, which also sets them
+        response = await client.get(
+            "/api/v1/auth/me", headers={"X-Trace-ID": "abc", "Authorization": "Bearer invalid"}
+        )
+
+        assert response.status_code == 401
+        assert response.headers.get_list("X-Trace-ID") == ["abc"]
+        assert response.headers.get_list("X-Request-ID") == ["abc"]
+
+    @pytest.mark.asyncio
+    async def test_trace_id_generated_when_not_provided(self, client: AsyncClient):
+        """Test a trace ID is generated and echoed in both headers when none is sent"""
+        response = await client.get("/health")
+
+        trace_ids = response.headers.get_list("X-Trace-ID")
+        assert len(trace_ids) == 1
+        assert response.headers.get_list("X-Request-ID") == trace_ids